@@ -6,25 +6,23 @@ These functions accept command line arguments and execute converter operations.
 
 import argparse
 import sys
-import os
-from pathlib import Path
-from converters import (
-    generate_jsonld_context,
-    generate_jsonld_schema,
-    generate_shacl_shapes,
-    generate_openapi_spec
-)
+
+# Converters are imported inside each command, so a run only loads what it uses
 
 
 def cli_generate_jsonld_context(args):
     """CLI wrapper for generate_jsonld_context."""
+    from converters import generate_jsonld_context
+    
     generate_jsonld_context(
         xsd_file=args.xsd_file,
         output_file=args.output_file,
         include_docs=args.include_docs,
         include_enums=args.include_enums,
         include_schema=args.include_schema,
-        shacl_file_url=getattr(args, 'shacl_file_url', None)
+        shacl_file_url=getattr(args, 'shacl_file_url', None),
+        cache_dir=args.cache_dir,
+        stream=args.stream
     )
     if args.output_file:
         print(f'✓ Generated: {args.output_file}')
@@ -32,11 +30,15 @@ def cli_generate_jsonld_context(args):
 
 def cli_generate_jsonld_schema(args):
     """CLI wrapper for generate_jsonld_schema."""
+    from converters import generate_jsonld_schema
+    
     generate_jsonld_schema(
         xsd_file=args.xsd_file,
         output_file=args.output_file,
         include_docs=args.include_docs,
-        include_enums=args.include_enums
+        include_enums=args.include_enums,
+        cache_dir=args.cache_dir,
+        stream=args.stream
     )
     if args.output_file:
         print(f'✓ Generated: {args.output_file}')
@@ -44,10 +46,14 @@ def cli_generate_jsonld_schema(args):
 
 def cli_generate_shacl_shapes(args):
     """CLI wrapper for generate_shacl_shapes."""
+    from converters import generate_shacl_shapes
+    
     generate_shacl_shapes(
         xsd_file=args.xsd_file,
         output_file=args.output_file,
-        include_docs=args.include_docs
+        include_docs=args.include_docs,
+        cache_dir=args.cache_dir,
+        stream=args.stream
     )
     if args.output_file:
         print(f'✓ Generated: {args.output_file}')
@@ -55,6 +61,8 @@ def cli_generate_shacl_shapes(args):
 
 def cli_generate_openapi_spec(args):
     """CLI wrapper for generate_openapi_spec."""
+    from converters import generate_openapi_spec
+    
     generate_openapi_spec(
         xsd_file=args.xsd_file,
         wadl_file=getattr(args, 'wadl_file', None),
@@ -64,7 +72,9 @@ def cli_generate_openapi_spec(args):
         include_docs=args.include_docs,
         include_enums=args.include_enums,
         include_context=args.include_context,
-        context_output_file=getattr(args, 'context_output_file', None)
+        context_output_file=getattr(args, 'context_output_file', None),
+        cache_dir=args.cache_dir,
+        yaml_comments=args.yaml_comments
     )
     if args.output_file:
         if args.include_context and getattr(args, 'context_output_file', None):
@@ -76,12 +86,31 @@ def cli_generate_openapi_spec(args):
             print(f'✓ Generated: {args.output_file}')
 
 
+def _add_common_arguments(subparser, enums=True, stream=True):
+    """Add the XSD/output file arguments and the --exclude-docs/--exclude-enums
+    (and, for JSON-LD outputs, --stream) flags."""
+    subparser.add_argument('xsd_file', help='Path to XSD file')
+    subparser.add_argument('output_file', help='Output file path')
+    subparser.add_argument('--exclude-docs', dest='include_docs', action='store_false',
+                           help='Exclude documentation/descriptions (default: included)')
+    if enums:
+        subparser.add_argument('--exclude-enums', dest='include_enums', action='store_false',
+                               help='Exclude enum values (default: included)')
+    if stream:
+        subparser.add_argument('--stream', action='store_true',
+                               help='Write the output incrementally to lower peak memory')
+
+
 def create_parser():
     """Create and configure the argument parser."""
     parser = argparse.ArgumentParser(
         description='IEEE 2030.5 Schema Converters - CLI Tools',
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
+    parser.add_argument('--cache-dir', type=str, default=None,
+                        help='Cache parsed XSD files (and JSON-LD outputs) in this directory '
+                             'to skip re-parsing on later runs (e.g. ~/.cache/xsd-to-openapi); '
+                             'only use a trusted directory, cached files are unpickled')
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
@@ -90,81 +119,48 @@ def create_parser():
         'jsonld-context',
         help='Generate JSON-LD Context'
     )
-    parser_context.add_argument('xsd_file', help='Path to XSD file')
-    parser_context.add_argument('output_file', help='Output file path')
-    parser_context.add_argument('--exclude-docs', dest='include_docs', action='store_false',
-                               help='Exclude documentation/descriptions (default: included)')
-    parser_context.add_argument('--exclude-enums', dest='include_enums', action='store_false',
-                               help='Exclude enum values (default: included)')
+    _add_common_arguments(parser_context)
     parser_context.add_argument('--exclude-schema', dest='include_schema', action='store_false',
                                help='Exclude schema relationships (default: included)')
     parser_context.add_argument('--shacl-file-url', type=str, default=None,
                                help='Optional URL to SHACL shapes file')
-    parser_context.set_defaults(
-        include_docs=True,
-        include_enums=True,
-        include_schema=True,
-        func=cli_generate_jsonld_context
-    )
+    parser_context.set_defaults(func=cli_generate_jsonld_context)
     
     # Command: jsonld-schema
     parser_schema = subparsers.add_parser(
         'jsonld-schema',
         help='Generate JSON-LD Schema (RDF/OWL)'
     )
-    parser_schema.add_argument('xsd_file', help='Path to XSD file')
-    parser_schema.add_argument('output_file', help='Output file path')
-    parser_schema.add_argument('--exclude-docs', dest='include_docs', action='store_false',
-                              help='Exclude documentation/descriptions (default: included)')
-    parser_schema.add_argument('--exclude-enums', dest='include_enums', action='store_false',
-                              help='Exclude enum values (default: included)')
-    parser_schema.set_defaults(
-        include_docs=True,
-        include_enums=True,
-        func=cli_generate_jsonld_schema
-    )
+    _add_common_arguments(parser_schema)
+    parser_schema.set_defaults(func=cli_generate_jsonld_schema)
     
     # Command: shacl
     parser_shacl = subparsers.add_parser(
         'shacl',
         help='Generate SHACL Shapes'
     )
-    parser_shacl.add_argument('xsd_file', help='Path to XSD file')
-    parser_shacl.add_argument('output_file', help='Output file path')
-    parser_shacl.add_argument('--exclude-docs', dest='include_docs', action='store_false',
-                             help='Exclude documentation/descriptions (default: included)')
-    parser_shacl.set_defaults(
-        include_docs=True,
-        func=cli_generate_shacl_shapes
-    )
+    _add_common_arguments(parser_shacl, enums=False)
+    parser_shacl.set_defaults(func=cli_generate_shacl_shapes)
     
     # Command: openapi
     parser_openapi = subparsers.add_parser(
         'openapi',
         help='Generate OpenAPI Specification'
     )
-    parser_openapi.add_argument('xsd_file', help='Path to XSD file')
-    parser_openapi.add_argument('output_file', help='Output file path')
+    _add_common_arguments(parser_openapi, stream=False)
     parser_openapi.add_argument('--wadl-file', type=str, default=None,
                                help='Path to WADL file (optional, adds paths if provided)')
     parser_openapi.add_argument('--api-title', type=str, default='IEEE 2030.5 API',
                                help='API title (default: IEEE 2030.5 API)')
     parser_openapi.add_argument('--api-version', type=str, default='1.0.0',
                                help='API version (default: 1.0.0)')
-    parser_openapi.add_argument('--exclude-docs', dest='include_docs', action='store_false',
-                               help='Exclude documentation/descriptions (default: included)')
-    parser_openapi.add_argument('--exclude-enums', dest='include_enums', action='store_false',
-                               help='Exclude enum values (default: included)')
     parser_openapi.add_argument('--exclude-context', dest='include_context', action='store_false',
                                help='Exclude JSON-LD context from OpenAPI spec (default: included)')
     parser_openapi.add_argument('--context-output-file', type=str, default=None,
                                help='Optional path to save context separately')
-    parser_openapi.set_defaults(
-        include_docs=True,
-        include_enums=True,
-        include_context=True,
-        func=cli_generate_openapi_spec
-    )
+    parser_openapi.add_argument('--no-yaml-comments', dest='yaml_comments', action='store_false',
+                               help='Write YAML output without explanatory comments (faster)')
+    parser_openapi.set_defaults(func=cli_generate_openapi_spec)
     
     return parser
 
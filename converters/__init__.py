@@ -2,17 +2,37 @@
 Converters package - Main entry points for XSD/WADL conversion.
 """
 
-from .jsonld import (
-    generate_jsonld_context,
-    generate_jsonld_schema,
-    generate_shacl_shapes
-)
-
-from .openapi import generate_openapi_spec
+# Entry points are resolved on first access (PEP 562), so e.g. the JSON-LD
+# commands never import the OpenAPI module and its YAML libraries
+_LAZY_ATTRS = {
+    'generate_jsonld_context': 'jsonld',
+    'generate_jsonld_schema': 'jsonld',
+    'generate_shacl_shapes': 'jsonld',
+    'generate_jsonld_all': 'jsonld',
+    'generate_openapi_spec': 'openapi'
+}
 
 __all__ = [
     'generate_jsonld_context',
     'generate_jsonld_schema',
     'generate_shacl_shapes',
+    'generate_jsonld_all',
     'generate_openapi_spec'
 ]
+
+
+def __getattr__(name):
+    """Import the submodule providing a public entry point on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module('.' + module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazily provided entry points alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
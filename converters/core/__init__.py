@@ -2,8 +2,10 @@
 Core parsing modules for XSD and WADL files.
 """
 
-from .xsd_parser import XSDParser
+from .xsd_parser import XSDParser, load_xsd, clear_xsd_cache, DEFAULT_CACHE_DIR
 from .wadl_parser import WADLParser
+from .cache import write_cache_file
 
-__all__ = ['XSDParser', 'WADLParser']
+__all__ = ['XSDParser', 'WADLParser', 'load_xsd', 'clear_xsd_cache', 'DEFAULT_CACHE_DIR',
+           'write_cache_file']
 
@@ -0,0 +1,23 @@
+"""
+On-disk cache helpers shared by the parsers and generators.
+"""
+
+import os
+
+
+def write_cache_file(cache_file, write):
+    """Write a cache entry atomically, so readers never see a partial file.
+    
+    Args:
+        cache_file: Path of the cache entry (its directory is created if missing)
+        write: Function that writes the entry to a binary file object
+    """
+    tmp_file = '%s.%d.tmp' % (cache_file, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            write(f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # The cache is an optimization only
+        pass
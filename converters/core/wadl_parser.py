@@ -2,7 +2,13 @@
 WADL parser - extracts API resource and method definitions.
 """
 
-import xml.etree.ElementTree as ET
+# Prefer lxml (libxml2-backed), fallback to the stdlib ElementTree
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
 
 ns_wadl = 'http://wadl.dev.java.net/2009/02'
 ns_wx = 'http://zigbee.org/wadlExt'
@@ -16,6 +22,22 @@ namespaces = {
     'xsd': ns_xsd
 }
 
+# Qualified attribute names
+_ATTR_SAMPLE_BASE = '{%s}sampleBase' % ns_wx
+_ATTR_SAMPLE_PATH = '{%s}samplePath' % ns_wx
+_ATTR_MODE = '{%s}mode' % ns_wx
+
+# Qualified tag names
+_TAG_RESOURCES = '{%s}resources' % ns_wadl
+_TAG_RESOURCE = '{%s}resource' % ns_wadl
+_TAG_METHOD = '{%s}method' % ns_wadl
+_TAG_REQUEST = '{%s}request' % ns_wadl
+_TAG_RESPONSE = '{%s}response' % ns_wadl
+_TAG_REPRESENTATION = '{%s}representation' % ns_wadl
+_TAG_PARAM = '{%s}param' % ns_wadl
+_TAG_DOC = '{%s}doc' % ns_wadl
+_TAG_SAMPLE_PARAM = '{%s}sampleParam' % ns_wx
+
 
 class WADLParser:
     """Parse WADL files and extract API resource definitions."""
@@ -23,136 +45,165 @@ class WADLParser:
     def __init__(self):
         self.resources = []
         self.base_url = None
-        
+    
     def parse(self, wadl_file):
         """Parse the WADL file and extract resource information.
         
+        The file is read in a single streaming pass: resources, methods,
+        requests/responses and parameters are built as their start tags are
+        seen, and documentation is bound on end tags once its text is complete.
+        Each resource lists only its own methods and sample parameters, and a
+        doc only documents its direct parent resource or request parameter.
+        
         Args:
             wadl_file: Path to WADL file
-            
+        
         Returns:
             self (for method chaining)
         """
-        tree = ET.parse(wadl_file)
-        root = tree.getroot()
-        
-        # Extract base URL from resources element
-        resources_elem = root.find('.//{%s}resources' % ns_wadl, namespaces)
-        if resources_elem is not None:
-            self.base_url = resources_elem.get('{%s}sampleBase' % ns_wx) or 'http://localhost/sep/'
-        
-        # Extract all resources
-        for resource in root.findall('.//{%s}resource' % ns_wadl, namespaces):
-            resource_info = self._extract_resource_info(resource)
-            if resource_info:
-                self.resources.append(resource_info)
+        # Currently open resources (innermost last), method, request/response and param
+        state = {
+            'resources': [],
+            'method': None,
+            'message': None,
+            'is_request': False,
+            'param': None
+        }
+        open_tags = []
+        
+        for event, elem in ET.iterparse(wadl_file, events=('start', 'end')):
+            tag = elem.tag
+            if event == 'start':
+                handler = self._START_HANDLERS.get(tag)
+                if handler is not None:
+                    handler(self, elem, state)
+                open_tags.append(tag)
+                continue
+            
+            open_tags.pop()
+            if tag == _TAG_DOC:
+                # Only bind documentation that directly belongs to the open
+                # resource or request parameter
+                parent = open_tags[-1] if open_tags else None
+                if parent == _TAG_RESOURCE:
+                    resource = state['resources'][-1]
+                    if resource['title'] is None and resource['description'] is None:
+                        resource['title'] = elem.get('title')
+                        resource['description'] = elem.text
+                elif parent == _TAG_PARAM and state['param'] is not None:
+                    state['param'].setdefault('description', elem.text)
+            elif tag == _TAG_RESOURCE:
+                state['resources'].pop()
+                elem.clear()
+            elif tag == _TAG_METHOD:
+                state['method'] = None
+            elif tag == _TAG_REQUEST or tag == _TAG_RESPONSE:
+                state['message'] = None
+            elif tag == _TAG_PARAM:
+                state['param'] = None
         
         return self
     
-    def _extract_resource_info(self, resource_elem):
-        """Extract information from a resource element.
-        
-        Returns:
-            dict: Resource information with path, methods, etc.
-        """
-        resource_id = resource_elem.get('id')
-        sample_path = resource_elem.get('{%s}samplePath' % ns_wx, '')
-        
-        # Extract documentation
-        doc_elem = resource_elem.find('.//{%s}doc' % ns_wadl, namespaces)
-        doc_title = doc_elem.get('title') if doc_elem is not None else None
-        doc_text = doc_elem.text if doc_elem is not None else None
-        
-        # Extract methods
-        methods = []
-        for method in resource_elem.findall('.//{%s}method' % ns_wadl, namespaces):
-            method_info = self._extract_method_info(method)
-            if method_info:
-                methods.append(method_info)
-        
-        # Extract template parameters
-        params = []
-        for param in resource_elem.findall('.//{%s}sampleParam' % ns_wx, namespaces):
-            param_info = {
-                'name': param.get('name'),
-                'style': param.get('style'),
-                'type': param.get('type')
-            }
-            params.append(param_info)
-        
-        return {
-            'id': resource_id,
-            'path': sample_path,
-            'title': doc_title,
-            'description': doc_text,
-            'methods': methods,
-            'parameters': params
+    def _on_resources(self, elem, state):
+        """Take the base URL from the first resources element."""
+        if self.base_url is None:
+            self.base_url = elem.get(_ATTR_SAMPLE_BASE) or 'http://localhost/sep/'
+    
+    def _on_resource(self, elem, state):
+        """Start a resource with its path; documentation is bound on end of doc."""
+        attrib = elem.attrib
+        resource_info = {
+            'id': attrib.get('id'),
+            'path': attrib.get(_ATTR_SAMPLE_PATH, ''),
+            'title': None,
+            'description': None,
+            'methods': [],
+            'parameters': []
         }
+        self.resources.append(resource_info)
+        state['resources'].append(resource_info)
     
-    def _extract_method_info(self, method_elem):
-        """Extract information from a method element.
-        
-        Returns:
-            dict: Method information with HTTP method, request/response, etc.
-        """
-        method_name = method_elem.get('name')
-        method_id = method_elem.get('id')
-        mode = method_elem.get('{%s}mode' % ns_wx)
-        
-        # Extract request
-        request_elem = method_elem.find('.//{%s}request' % ns_wadl, namespaces)
-        request = None
-        if request_elem is not None:
-            request = self._extract_request_response(request_elem, is_request=True)
-        
-        # Extract responses
-        responses = []
-        for response_elem in method_elem.findall('.//{%s}response' % ns_wadl, namespaces):
-            response = self._extract_request_response(response_elem, is_request=False)
-            response['status'] = response_elem.get('status', '200')
-            responses.append(response)
-        
-        return {
-            'id': method_id,
-            'name': method_name,
-            'mode': mode,
-            'request': request,
-            'responses': responses
+    def _on_method(self, elem, state):
+        """Start a method of the innermost open resource."""
+        if not state['resources']:
+            return
+        attrib = elem.attrib
+        method_info = {
+            'id': attrib.get('id'),
+            'name': attrib.get('name'),
+            'mode': attrib.get(_ATTR_MODE),
+            'request': None,
+            'responses': []
         }
+        state['resources'][-1]['methods'].append(method_info)
+        state['method'] = method_info
     
-    def _extract_request_response(self, elem, is_request=False):
-        """Extract request or response information.
-        
-        Returns:
-            dict: Request/response information with representations, parameters, etc.
-        """
-        result = {
+    def _on_request(self, elem, state):
+        """Start the (first) request of the open method."""
+        method = state['method']
+        if method is None or method['request'] is not None:
+            state['message'] = None
+            return
+        method['request'] = state['message'] = {
             'representations': [],
             'parameters': []
         }
-        
-        # Extract representations
-        for repr_elem in elem.findall('.//{%s}representation' % ns_wadl, namespaces):
-            repr_info = {
-                'mediaType': repr_elem.get('mediaType'),
-                'element': repr_elem.get('element')
-            }
-            result['representations'].append(repr_info)
-        
-        # Extract parameters (for requests)
-        if is_request:
-            for param_elem in elem.findall('.//{%s}param' % ns_wadl, namespaces):
-                param_info = {
-                    'name': param_elem.get('name'),
-                    'style': param_elem.get('style'),
-                    'type': param_elem.get('type'),
-                    'required': param_elem.get('required', 'false') == 'true'
-                }
-                # Extract parameter documentation
-                doc_elem = param_elem.find('.//{%s}doc' % ns_wadl, namespaces)
-                if doc_elem is not None:
-                    param_info['description'] = doc_elem.text
-                result['parameters'].append(param_info)
-        
-        return result
-
+        state['is_request'] = True
+    
+    def _on_response(self, elem, state):
+        """Start a response of the open method."""
+        method = state['method']
+        if method is None:
+            state['message'] = None
+            return
+        response = state['message'] = {
+            'representations': [],
+            'parameters': []
+        }
+        response['status'] = elem.get('status', '200')
+        method['responses'].append(response)
+        state['is_request'] = False
+    
+    def _on_representation(self, elem, state):
+        """Add a representation to the open request/response."""
+        if state['message'] is not None:
+            attrib = elem.attrib
+            state['message']['representations'].append({
+                'mediaType': attrib.get('mediaType'),
+                'element': attrib.get('element')
+            })
+    
+    def _on_param(self, elem, state):
+        """Add a parameter to the open request (response params are ignored)."""
+        if state['message'] is None or not state['is_request']:
+            return
+        attrib = elem.attrib
+        param_info = {
+            'name': attrib.get('name'),
+            'style': attrib.get('style'),
+            'type': attrib.get('type'),
+            'required': attrib.get('required', 'false') == 'true'
+        }
+        state['message']['parameters'].append(param_info)
+        state['param'] = param_info
+    
+    def _on_sample_param(self, elem, state):
+        """Add a template parameter to the innermost open resource."""
+        if state['resources']:
+            attrib = elem.attrib
+            state['resources'][-1]['parameters'].append({
+                'name': attrib.get('name'),
+                'style': attrib.get('style'),
+                'type': attrib.get('type')
+            })
+    
+    _START_HANDLERS = {
+        _TAG_RESOURCES: _on_resources,
+        _TAG_RESOURCE: _on_resource,
+        _TAG_METHOD: _on_method,
+        _TAG_REQUEST: _on_request,
+        _TAG_RESPONSE: _on_response,
+        _TAG_REPRESENTATION: _on_representation,
+        _TAG_PARAM: _on_param,
+        _TAG_SAMPLE_PARAM: _on_sample_param
+    }
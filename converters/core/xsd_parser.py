@@ -2,70 +2,236 @@
 Core XSD parser - extracts schema information without generating output.
 """
 
-import xml.etree.ElementTree as ET
+import hashlib
+import os
+import pickle
 import re
-from collections import defaultdict
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from .cache import write_cache_file
+
+# Prefer lxml (libxml2-backed, compiled XPath), fallback to the stdlib ElementTree
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
 
 ns_xs = 'http://www.w3.org/2001/XMLSchema'
 ns = {'xs': ns_xs}
 
+# Conventional location for XSDParser.parse(cache_dir=...)
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'xsd-to-openapi')
+# Parse results cached on disk, and the version of their pickled layout
+_CACHED_FIELDS = ('base_uri', 'types', 'elements', 'namespace', 'target_namespace')
+_CACHE_VERSION = '1'
+
+# Top-level types always extracted inline; only types beyond these go to a
+# process pool. Extracting this many takes tens of milliseconds (sep.xsd has
+# 349 types), about what starting the pool costs
+_PARALLEL_MIN_TYPES = 1000
+
+_TAG_COMPLEX_TYPE = '{%s}complexType' % ns_xs
+_TAG_SIMPLE_TYPE = '{%s}simpleType' % ns_xs
+_TAG_ELEMENT = '{%s}element' % ns_xs
+_TAG_ATTRIBUTE = '{%s}attribute' % ns_xs
+_TAG_EXTENSION = '{%s}extension' % ns_xs
+_TAG_RESTRICTION = '{%s}restriction' % ns_xs
+_TAG_ENUMERATION = '{%s}enumeration' % ns_xs
+_TAG_ANNOTATION = '{%s}annotation' % ns_xs
+_TAG_DOCUMENTATION = '{%s}documentation' % ns_xs
+# Content wrappers and model groups whose children belong to the enclosing type
+_TAGS_PASS_THROUGH = frozenset((
+    '{%s}complexContent' % ns_xs, '{%s}simpleContent' % ns_xs,
+    '{%s}sequence' % ns_xs, '{%s}choice' % ns_xs, '{%s}all' % ns_xs
+))
+
+# Descendant search paths
+_PATH_ANNOTATION = './/' + _TAG_ANNOTATION
+_PATH_DOCUMENTATION = './/' + _TAG_DOCUMENTATION
+
+# Enum documentation pattern, see XSDParser._parse_enum_values. One match per
+# line: "number = value", "number - value", "number: value", or a range
+# "number - number: description" (group 2 is only set for ranges)
+_ENUM_LINE_RE = re.compile(
+    r'^[^\S\n]*(\d+)(?:[^\S\n]*-[^\S\n]*(\d+)[^\S\n]*:|[^\S\n]*[=\-:])[^\S\n]*(\S.*?)[^\S\n]*$',
+    re.MULTILINE
+)
+# "(default, if not specified)" or similar
+_DEFAULT_RE = re.compile(r'\s*\([^)]*default[^)]*\)', re.IGNORECASE)
+
 
 class XSDParser:
     """Parse XSD schema files and extract structured information."""
     
+    __slots__ = ('base_uri', 'types', 'elements', 'namespace', 'target_namespace',
+                 '_doc_cache')
+    
     def __init__(self, base_uri=None):
         self.base_uri = base_uri or "https://schemas.ieee.org/2030.5/"
         self.types = {}
         self.elements = {}
-        self.attributes = defaultdict(list)
         self.namespace = None
         self.target_namespace = None
+        self._doc_cache = {}
         
-    def parse(self, xsd_file):
+    def parse(self, xsd_file, workers=1, cache_dir=None):
         """Parse the XSD file and extract schema information.
         
         Args:
             xsd_file: Path to XSD file
+            workers: Number of processes used to extract type definitions.
+                With more than one worker, top-level types after the first
+                _PARALLEL_MIN_TYPES are serialized during the streaming pass
+                and extracted in a process pool; smaller schemas are extracted
+                inline as with one worker.
+            cache_dir: Optional directory (e.g. DEFAULT_CACHE_DIR) holding
+                pickled parse results, keyed by the file's content, mtime and
+                base_uri. A hit skips parsing entirely. Only use a trusted
+                directory: loading a pickle can run arbitrary code.
             
         Returns:
             self (for method chaining)
         """
-        tree = ET.parse(xsd_file)
-        root = tree.getroot()
+        cache_file = None
+        if cache_dir:
+            cache_file = self._cache_file(xsd_file, cache_dir)
+            if self._load_cache(cache_file):
+                return self
         
-        # Extract namespace information
-        self.namespace = root.get('targetNamespace')
-        if self.namespace:
-            self.target_namespace = self.namespace
-            # Use namespace as base URI if not provided
-            if not self.base_uri.startswith('http'):
-                self.base_uri = self.namespace.replace('urn:', 'https://').replace(':', '/')
+        # Named types are collected per kind so that complex types keep
+        # preceding simple types in self.types, regardless of document order
+        complex_types = {}
+        simple_types = {}
+        # (target dict, name, serialized type) when extracting in parallel
+        pending = []
+        # Top-level types seen so far; the first _PARALLEL_MIN_TYPES are
+        # always extracted inline
+        type_count = 0
+        root = None
+        depth = 0
         
-        # Extract all complex types
-        for complex_type in root.findall('.//{%s}complexType' % ns_xs, ns):
-            name = complex_type.get('name')
+        # Single streaming pass: top-level types are extracted as soon as their
+        # subtree is complete, then released to keep memory bounded
+        elements = self.elements
+        for event, elem in ET.iterparse(xsd_file, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                if root is None:
+                    root = elem
+                    self._set_namespace(root.get('targetNamespace'))
+                elif elem.tag == _TAG_ELEMENT:
+                    # Elements are registered on start so they stay in document order
+                    attrib = elem.attrib
+                    name = attrib.get('name')
+                    if name:
+                        elements[name] = {
+                            'type': attrib.get('type'),
+                            'minOccurs': attrib.get('minOccurs', '1'),
+                            'maxOccurs': attrib.get('maxOccurs', '1')
+                        }
+                continue
+            
+            depth -= 1
+            if depth != 1:
+                continue
+            
+            # A direct child of xs:schema is complete
+            name = elem.get('name')
             if name:
-                self.types[name] = self._extract_type_info(complex_type)
+                tag = elem.tag
+                target = None
+                if tag == _TAG_COMPLEX_TYPE:
+                    target = complex_types
+                elif tag == _TAG_SIMPLE_TYPE:
+                    target = simple_types
+                if target is not None:
+                    if workers > 1 and type_count >= _PARALLEL_MIN_TYPES:
+                        # Reserve the slot now so dict order matches the serial path
+                        target[name] = None
+                        pending.append((target, name, ET.tostring(elem)))
+                    else:
+                        target[name] = self._extract_type_info(elem)
+                    type_count += 1
+            self._release(elem, root)
         
-        # Extract all simple types
-        for simple_type in root.findall('.//{%s}simpleType' % ns_xs, ns):
-            name = simple_type.get('name')
-            if name:
-                self.types[name] = self._extract_type_info(simple_type)
+        if pending:
+            self._extract_serialized(pending, workers)
         
-        # Extract root elements
-        for element in root.findall('.//{%s}element' % ns_xs, ns):
-            name = element.get('name')
-            etype = element.get('type')
-            if name:
-                self.elements[name] = {
-                    'type': etype,
-                    'minOccurs': element.get('minOccurs', '1'),
-                    'maxOccurs': element.get('maxOccurs', '1')
-                }
+        self.types.update(complex_types)
+        self.types.update(simple_types)
+        
+        if cache_file:
+            self._save_cache(cache_file)
         
         return self
     
+    def _cache_file(self, xsd_file, cache_dir):
+        """Path of the cached parse result for xsd_file."""
+        with open(xsd_file, 'rb') as f:
+            digest = hashlib.sha1(f.read())
+        digest.update(('|%s|%s|%s' % (os.path.getmtime(xsd_file), self.base_uri,
+                                      _CACHE_VERSION)).encode('utf-8'))
+        return os.path.join(cache_dir, digest.hexdigest() + '.pkl')
+    
+    def _load_cache(self, cache_file):
+        """Restore a cached parse result; returns False if there is none."""
+        try:
+            with open(cache_file, 'rb') as f:
+                state = pickle.load(f)
+            if not isinstance(state, dict):
+                raise pickle.UnpicklingError('not a parse result')
+            values = [state[field] for field in _CACHED_FIELDS]
+        except FileNotFoundError:
+            return False
+        except (OSError, EOFError, ValueError, KeyError, pickle.UnpicklingError,
+                AttributeError, ImportError) as e:
+            # Unreadable or foreign cache entry: parse normally (and replace it)
+            warnings.warn('Ignoring unusable XSD cache entry %s (%s: %s)'
+                          % (cache_file, type(e).__name__, e))
+            return False
+        for field, value in zip(_CACHED_FIELDS, values):
+            setattr(self, field, value)
+        return True
+    
+    def _save_cache(self, cache_file):
+        """Store the parse result."""
+        state = {field: getattr(self, field) for field in _CACHED_FIELDS}
+        write_cache_file(cache_file,
+                         lambda f: pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL))
+    
+    def _extract_serialized(self, pending, workers):
+        """Extract serialized top-level types in a process pool."""
+        blobs = [data for _, _, data in pending]
+        chunksize = max(1, len(blobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            infos = list(executor.map(_extract_serialized_type, blobs, chunksize=chunksize))
+        for (target, name, _), info in zip(pending, infos):
+            target[name] = info
+    
+    def _set_namespace(self, namespace):
+        """Record the schema's targetNamespace and derive base_uri from it."""
+        self.namespace = namespace
+        if self.namespace:
+            self.target_namespace = self.namespace
+            # Use namespace as base URI if not provided
+            if not self.base_uri.startswith('http'):
+                self.base_uri = self.namespace.replace('urn:', 'https://').replace(':', '/')
+    
+    @staticmethod
+    def _release(elem, root):
+        """Free a processed top-level subtree during iterparse."""
+        elem.clear()
+        if HAS_LXML:
+            # Also drop the (already cleared) preceding siblings
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        else:
+            root.remove(elem)
+    
     def _parse_enum_values(self, doc_text):
         """Parse enum values from documentation text.
         
@@ -83,51 +249,21 @@ class XSDParser:
         enum_values = {}
         range_info = []
         
-        # Pattern to match: number = value, number - value, or number: value
-        pattern = r'^(\d+)\s*([=\-:])\s*(.+?)(?:\n|$)'
-        
-        # Pattern to match ranges: number - number: description
-        range_pattern = r'^(\d+)\s*-\s*(\d+)\s*:\s*(.+?)(?:\n|$)'
-        
-        for line in doc_text.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            
-            # First check if it's a range
-            range_match = re.match(range_pattern, line)
-            if range_match:
-                start = range_match.group(1)
-                end = range_match.group(2)
-                desc = range_match.group(3).strip()
-                # Clean up description
-                desc = desc.rstrip('.,;')
-                desc = re.sub(r'\s*\([^)]*default[^)]*\)', '', desc, flags=re.IGNORECASE)
-                desc = desc.strip()
+        # A single scan over the whole text; lines that don't start with a
+        # number (prose, "reserved" notes) never match
+        for match in _ENUM_LINE_RE.finditer(doc_text):
+            start, end, text = match.groups()
+            # Clean up (remove trailing periods, etc.) and drop
+            # "(default, if not specified)" or similar
+            text = _DEFAULT_RE.sub('', text.strip().rstrip('.,;')).strip()
+            if end is not None:
                 range_info.append({
                     'start': int(start),
                     'end': int(end),
-                    'description': desc
+                    'description': text
                 })
-                continue
-            
-            # Skip lines that just say "reserved" without a number
-            if 'reserved' in line.lower() and not re.search(r'\d', line):
-                continue
-            
-            # Check for single enum values
-            match = re.match(pattern, line)
-            if match:
-                enum_key = match.group(1)
-                separator = match.group(2)
-                enum_value = match.group(3).strip()
-                
-                # Clean up enum value (remove trailing periods, etc.)
-                enum_value = enum_value.rstrip('.,;')
-                # Remove "(default, if not specified)" or similar from value
-                enum_value = re.sub(r'\s*\([^)]*default[^)]*\)', '', enum_value, flags=re.IGNORECASE)
-                enum_value = enum_value.strip()
-                enum_values[enum_key] = enum_value
+            else:
+                enum_values[start] = text
         
         return (enum_values if enum_values else None, 
                 range_info if range_info else None)
@@ -138,11 +274,11 @@ class XSDParser:
         Returns:
             tuple: (documentation_text, (enum_values_dict, range_info_list))
         """
-        annotation = elem.find('.//{%s}annotation' % ns_xs, ns)
+        annotation = elem.find(_PATH_ANNOTATION, ns)
         if annotation is None:
             return None, None
         
-        doc_elem = annotation.find('.//{%s}documentation' % ns_xs, ns)
+        doc_elem = annotation.find(_PATH_DOCUMENTATION, ns)
         if doc_elem is None:
             return None, None
         
@@ -151,14 +287,106 @@ class XSDParser:
         if doc_elem.tail:
             doc_text += doc_elem.tail
         
+        # Identical documentation blocks recur across types and elements,
+        # so parse each distinct text once (cached results are read-only)
+        cached = self._doc_cache.get(doc_text)
+        if cached is not None:
+            return cached
+        
         # Try to parse enum values and ranges from documentation
         enum_values, range_info = self._parse_enum_values(doc_text)
         
         # Return tuple if we have either enum_values or range_info
         if enum_values or range_info:
-            return doc_text.strip() if doc_text.strip() else None, (enum_values, range_info)
+            result = doc_text.strip() if doc_text.strip() else None, (enum_values, range_info)
         else:
-            return doc_text.strip() if doc_text.strip() else None, None
+            result = doc_text.strip() if doc_text.strip() else None, None
+        self._doc_cache[doc_text] = result
+        return result
+    
+    def _walk_content(self, parent, info):
+        """Walk a type's content model once, dispatching on tag.
+        
+        Passes through complexContent/simpleContent wrappers and
+        sequence/choice/all groups, but never descends into element bodies or
+        nested inline types, whose fields belong to those types.
+        """
+        get_handler = self._CONTENT_HANDLERS.get
+        for child in parent:
+            # Read .tag once: lxml builds a new string on every access
+            tag = child.tag
+            handler = get_handler(tag)
+            if handler is not None:
+                handler(self, child, info)
+            elif tag in _TAGS_PASS_THROUGH:
+                self._walk_content(child, info)
+    
+    def _on_extension(self, extension, info):
+        """Record the base type and walk the extension's content."""
+        info['base'] = extension.get('base')
+        self._walk_content(extension, info)
+    
+    def _on_restriction(self, restriction, info):
+        """Record the restricted base type and walk the restriction's content."""
+        info['restriction'] = restriction.get('base')
+        if info['enum_values'] is not None:
+            # Copy, since enum values parsed from documentation are cached
+            info['enum_values'] = dict(info['enum_values'])
+        self._walk_content(restriction, info)
+    
+    def _on_enumeration(self, enum, info):
+        """Add an xs:enumeration value (with its documentation) to the type."""
+        if info['enum_values'] is None:
+            info['enum_values'] = {}
+        value = enum.get('value')
+        if value:
+            # Try to get enum documentation
+            enum_doc, _ = self._extract_documentation(enum)
+            info['enum_values'][value] = enum_doc if enum_doc else value
+    
+    def _on_attribute(self, attr, info):
+        """Add an xs:attribute to the type."""
+        attrib = attr.attrib
+        attr_info = {
+            'name': attrib.get('name'),
+            'type': attrib.get('type'),
+            'use': attrib.get('use', 'optional'),
+            'default': attrib.get('default')
+        }
+        # Extract attribute documentation
+        attr_doc, _ = self._extract_documentation(attr)
+        if attr_doc:
+            attr_info['documentation'] = attr_doc
+        info['attributes'].append(attr_info)
+    
+    def _on_element(self, elem, info):
+        """Add an xs:element particle (with documentation and enum values) to the type."""
+        attrib = elem.attrib
+        elem_info = {
+            'name': attrib.get('name'),
+            'type': attrib.get('type'),
+            'minOccurs': attrib.get('minOccurs', '1'),
+            'maxOccurs': attrib.get('maxOccurs', '1')
+        }
+        # Extract element documentation and enum values
+        elem_doc, elem_enum_data = self._extract_documentation(elem)
+        if elem_doc:
+            elem_info['documentation'] = elem_doc
+        if elem_enum_data:
+            if isinstance(elem_enum_data, tuple):
+                elem_info['enum_values'] = elem_enum_data[0]
+                elem_info['enum_ranges'] = elem_enum_data[1]
+            else:
+                elem_info['enum_values'] = elem_enum_data
+        info['elements'].append(elem_info)
+    
+    _CONTENT_HANDLERS = {
+        _TAG_EXTENSION: _on_extension,
+        _TAG_RESTRICTION: _on_restriction,
+        _TAG_ENUMERATION: _on_enumeration,
+        _TAG_ATTRIBUTE: _on_attribute,
+        _TAG_ELEMENT: _on_element
+    }
     
     def _extract_type_info(self, type_elem):
         """Extract information from a type element.
@@ -166,98 +394,69 @@ class XSDParser:
         Returns:
             dict: Type information with elements, attributes, base, documentation, etc.
         """
-        info = {
-            'elements': [],
-            'attributes': [],
-            'base': None,
-            'restriction': None,
-            'documentation': None,
-            'enum_values': None,
-            'enum_ranges': None
-        }
-        
         # Extract documentation and enum values
         doc_text, enum_data = self._extract_documentation(type_elem)
-        info['documentation'] = doc_text
         if isinstance(enum_data, tuple):
             # New format: (enum_values, range_info)
-            info['enum_values'] = enum_data[0]
-            info['enum_ranges'] = enum_data[1]
+            enum_values, enum_ranges = enum_data
         else:
             # Old format: just enum_values (for backward compatibility)
-            info['enum_values'] = enum_data
-        
-        # Check for extension or restriction
-        extension = type_elem.find('.//{%s}extension' % ns_xs, ns)
-        if extension is not None:
-            info['base'] = extension.get('base')
-            # Extract elements from extension
-            for elem in extension.findall('.//{%s}element' % ns_xs, ns):
-                elem_info = {
-                    'name': elem.get('name'),
-                    'type': elem.get('type'),
-                    'minOccurs': elem.get('minOccurs', '1'),
-                    'maxOccurs': elem.get('maxOccurs', '1')
-                }
-                # Extract element documentation and enum values
-                elem_doc, elem_enum_data = self._extract_documentation(elem)
-                if elem_doc:
-                    elem_info['documentation'] = elem_doc
-                if elem_enum_data:
-                    if isinstance(elem_enum_data, tuple):
-                        elem_info['enum_values'] = elem_enum_data[0]
-                        elem_info['enum_ranges'] = elem_enum_data[1]
-                    else:
-                        elem_info['enum_values'] = elem_enum_data
-                info['elements'].append(elem_info)
+            enum_values, enum_ranges = enum_data, None
         
-        restriction = type_elem.find('.//{%s}restriction' % ns_xs, ns)
-        if restriction is not None:
-            info['restriction'] = restriction.get('base')
-            # Check for enumeration in restriction
-            for enum in restriction.findall('.//{%s}enumeration' % ns_xs, ns):
-                if info['enum_values'] is None:
-                    info['enum_values'] = {}
-                value = enum.get('value')
-                if value:
-                    # Try to get enum documentation
-                    enum_doc, _ = self._extract_documentation(enum)
-                    info['enum_values'][value] = enum_doc if enum_doc else value
-        
-        # Extract attributes
-        for attr in type_elem.findall('.//{%s}attribute' % ns_xs, ns):
-            attr_info = {
-                'name': attr.get('name'),
-                'type': attr.get('type'),
-                'use': attr.get('use', 'optional'),
-                'default': attr.get('default')
-            }
-            # Extract attribute documentation
-            attr_doc, _ = self._extract_documentation(attr)
-            if attr_doc:
-                attr_info['documentation'] = attr_doc
-            info['attributes'].append(attr_info)
+        # Build the record in one literal rather than filling it key by key
+        info = {
+            'elements': [],
+            'attributes': [],
+            'base': None,
+            'restriction': None,
+            'documentation': doc_text,
+            'enum_values': enum_values,
+            'enum_ranges': enum_ranges
+        }
         
-        # Extract elements (if not in extension)
-        if extension is None:
-            for elem in type_elem.findall('.//{%s}element' % ns_xs, ns):
-                elem_info = {
-                    'name': elem.get('name'),
-                    'type': elem.get('type'),
-                    'minOccurs': elem.get('minOccurs', '1'),
-                    'maxOccurs': elem.get('maxOccurs', '1')
-                }
-                # Extract element documentation and enum values
-                elem_doc, elem_enum_data = self._extract_documentation(elem)
-                if elem_doc:
-                    elem_info['documentation'] = elem_doc
-                if elem_enum_data:
-                    if isinstance(elem_enum_data, tuple):
-                        elem_info['enum_values'] = elem_enum_data[0]
-                        elem_info['enum_ranges'] = elem_enum_data[1]
-                    else:
-                        elem_info['enum_values'] = elem_enum_data
-                info['elements'].append(elem_info)
+        # Extension/restriction, enumerations, attributes and elements
+        self._walk_content(type_elem, info)
         
         return info
 
+
+@lru_cache(maxsize=8)
+def _load_xsd(path, mtime, cache_dir):
+    """Parse path once per (path, mtime, cache_dir) in this process."""
+    return XSDParser().parse(path, cache_dir=cache_dir)
+
+
+def load_xsd(xsd_file, cache_dir=None):
+    """Return a parsed XSDParser for xsd_file, shared within the process.
+    
+    Generating several outputs from the same schema then parses it only once
+    (again if the file changes). The returned parser is shared, so treat its
+    types and elements as read-only.
+    
+    Args:
+        xsd_file: Path to XSD file
+        cache_dir: Optional on-disk cache directory (must be trusted, its
+            pickles are executed on load), see XSDParser.parse
+        
+    Returns:
+        XSDParser: Parsed schema
+    """
+    path = os.path.abspath(xsd_file)
+    return _load_xsd(path, os.path.getmtime(path), cache_dir)
+
+
+def clear_xsd_cache():
+    """Drop the parsers shared by load_xsd (e.g. between tests)."""
+    _load_xsd.cache_clear()
+
+
+# Per-process parser reused by _extract_serialized_type (keeps its doc cache warm)
+_worker_parser = None
+
+
+def _extract_serialized_type(data):
+    """Process-pool worker: extract one serialized top-level type definition."""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = XSDParser()
+    return _worker_parser._extract_type_info(ET.fromstring(data))
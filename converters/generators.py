@@ -3,8 +3,208 @@ Generation logic for JSON-LD, SHACL, and JSON Schema from parsed XSD.
 This module is self-contained and uses the XSDParser from converters.core.
 """
 
+import json
+import re
+from concurrent.futures import ProcessPoolExecutor
+
 from converters.core import XSDParser
 
+# Prefer orjson (C encoder) for the *_bytes variants, fallback to the stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Namespace prefixes of the JSON-LD context and schema documents
+_JSONLD_PREFIXES = {
+    "xsd": "http://www.w3.org/2001/XMLSchema#",
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
+    "owl": "http://www.w3.org/2002/07/owl#"
+}
+
+# Namespace prefixes of the SHACL document
+_SHACL_PREFIXES = {
+    "sh": "http://www.w3.org/ns/shacl#",
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
+    "xsd": "http://www.w3.org/2001/XMLSchema#",
+    "owl": "http://www.w3.org/2002/07/owl#"
+}
+
+# Built-in XSD types as JSON-LD context terms
+_CONTEXT_XSD_TYPES = {
+    "string": "xsd:string",
+    "int": "xsd:int",
+    "long": "xsd:long",
+    "boolean": "xsd:boolean",
+    "unsignedByte": "xsd:unsignedByte",
+    "unsignedShort": "xsd:unsignedShort",
+    "unsignedInt": "xsd:unsignedInt",
+    "unsignedLong": "xsd:unsignedLong",
+    "byte": "xsd:byte",
+    "short": "xsd:short",
+    "anyURI": "xsd:anyURI",
+    "hexBinary": "xsd:hexBinary"
+}
+
+# Built-in XSD types as SHACL sh:datatype values
+_XSD_DATATYPES = {
+    'string': 'xsd:string',
+    'int': 'xsd:integer',
+    'long': 'xsd:long',
+    'boolean': 'xsd:boolean',
+    'unsignedByte': 'xsd:unsignedByte',
+    'unsignedShort': 'xsd:unsignedShort',
+    'unsignedInt': 'xsd:unsignedInt',
+    'unsignedLong': 'xsd:unsignedLong',
+    'byte': 'xsd:byte',
+    'short': 'xsd:short',
+    'anyURI': 'xsd:anyURI',
+    'hexBinary': 'xsd:hexBinary'
+}
+
+# Built-in XSD types as JSON Schema types
+_XSD_TO_JSON = {
+    'string': 'string',
+    'int': 'integer',
+    'long': 'integer',
+    'boolean': 'boolean',
+    'unsignedByte': 'integer',
+    'unsignedShort': 'integer',
+    'unsignedInt': 'integer',
+    'unsignedLong': 'integer',
+    'byte': 'integer',
+    'short': 'integer',
+    'anyURI': 'string',
+    'hexBinary': 'string'
+}
+
+_BUILTIN_XSD_TYPES = frozenset(_XSD_TO_JSON)
+
+# Built-in XSD integer types
+_XSD_INTEGER_TYPES = frozenset((
+    'unsignedByte', 'unsignedShort', 'unsignedInt', 'unsignedLong',
+    'byte', 'short', 'int', 'long'
+))
+
+# Integer types (IEEE 2030.5 and built-in XSD) that get numeric enum values
+_NUMERIC_TYPES = frozenset((
+    'Int8', 'Int16', 'Int32', 'Int48', 'Int64',
+    'UInt8', 'UInt16', 'UInt32', 'UInt40', 'UInt48', 'UInt64',
+    'int', 'long', 'unsignedByte', 'unsignedShort',
+    'unsignedInt', 'unsignedLong', 'byte', 'short'
+))
+
+
+# Below this many content types, process start-up outweighs parallel shape building
+_PARALLEL_MIN_SHAPES = 256
+
+# Parsed minOccurs/maxOccurs values, see _parse_occurs
+_OCCURS = {str(i): i for i in range(64)}
+
+
+def _parse_occurs(value, default):
+    """Parse a minOccurs/maxOccurs value; default if it isn't a number (e.g. 'unbounded')."""
+    parsed = _OCCURS.get(value)
+    if parsed is None:
+        parsed = int(value) if value.isdigit() else default
+    return parsed
+
+
+# hexBinary<N> base types with a bitmask pattern, and the size in their name
+_HEX_BINARY_SIZES = frozenset((8, 16, 32, 48, 64, 160))
+_HEX_SIZE_RE = re.compile(r'HexBinary(\d+)')
+
+# Value bounds of unsigned integer types; XSD names match exactly, IEEE 2030.5
+# names (UInt8, ...) anywhere in the type name
+_INT_BOUNDS = {
+    'UInt8': (0, 255), 'unsignedByte': (0, 255),
+    'UInt16': (0, 65535), 'unsignedShort': (0, 65535),
+    'UInt32': (0, 4294967295), 'unsignedInt': (0, 4294967295)
+}
+_UINT_BOUNDS = tuple((name, bounds) for name, bounds in _INT_BOUNDS.items()
+                     if name.startswith('UInt'))
+
+# JSON Schema pattern (1 to N/4 hex characters, since each hex char is 4 bits)
+# and x-examples of bitmask properties, by hexBinary size
+_HEX_BINARY_PATTERNS = {
+    size: f"^[0-9A-Fa-f]{{1,{size // 4}}}$" for size in _HEX_BINARY_SIZES
+}
+_HEX_BINARY_EXAMPLES = {
+    size: (
+        "00000001",  # Only bit 0 set (for 32-bit)
+        "00000003",  # Bits 0 and 1 set
+        "FFFFFFFF" if size >= 32 else "FF"  # All bits set
+    )
+    for size in _HEX_BINARY_SIZES
+}
+
+# OpenAPI formats of integer types: IEEE 2030.5 names match case-insensitively
+# (UInt8, ...), XSD names exactly
+_INT_FORMATS = {
+    name: name for name in ('uint8', 'uint16', 'uint32', 'uint64',
+                            'int8', 'int16', 'int32', 'int64')
+}
+_XSD_INT_FORMATS = {
+    'unsignedByte': 'uint8', 'unsignedShort': 'uint16',
+    'unsignedInt': 'uint32', 'unsignedLong': 'uint64',
+    'byte': 'int8', 'short': 'int16', 'int': 'int32', 'long': 'int64'
+}
+
+# Array wrapper of repeated properties, copied and filled in per property
+_ARRAY_TEMPLATE = {"type": "array", "items": None}
+
+
+def _name_kind(type_name):
+    """Classify a type name by the IEEE 2030.5 naming scheme.
+    
+    Returns 'integer' (UInt8, Int64, ...), 'string' (String32, ...),
+    'hexBinary' (HexBinary16, ...) or None. Tokens match anywhere in the
+    name ('UInt' contains 'Int').
+    """
+    if 'Int' in type_name:
+        return 'integer'
+    if 'String' in type_name:
+        return 'string'
+    if 'HexBinary' in type_name:
+        return 'hexBinary'
+    return None
+
+
+def _integer_bounds(type_name):
+    """Get (minimum, maximum) for unsigned 8/16/32-bit integer types, else None."""
+    bounds = _INT_BOUNDS.get(type_name)
+    if bounds is None:
+        for name, name_bounds in _UINT_BOUNDS:
+            if name in type_name:
+                return name_bounds
+    return bounds
+
+
+def _hex_binary_size(type_name):
+    """Get the bit size of a HexBinary<N> type, else None."""
+    match = _HEX_SIZE_RE.search(type_name)
+    if match:
+        size = int(match.group(1))
+        if size in _HEX_BINARY_SIZES:
+            return size
+    return None
+
+
+def _int_or_str(value):
+    """Convert an (optionally negative) decimal string to int, else return it unchanged."""
+    digits = value[1:] if value.startswith('-') else value
+    return int(value) if digits.isdecimal() else value
+
+
+def _strip_xs(type_name):
+    """Drop the 'xs:' prefix from a type name ('' if there is no type)."""
+    if not type_name:
+        return ''
+    return type_name[3:] if type_name.startswith('xs:') else type_name
+
 
 class XSDGenerator:
     """Generate various output formats from parsed XSD data."""
@@ -19,6 +219,24 @@ class XSDGenerator:
         self.base_uri = parser.base_uri
         self.types = parser.types
         self.elements = parser.elements
+        # (enum_values, enum_ranges, documentation) per type, for property loops
+        self._type_index = {
+            name: (info.get('enum_values'), info.get('enum_ranges'), info.get('documentation'))
+            for name, info in self.types.items()
+        }
+        # Types with elements or attributes, the only ones with SHACL shapes
+        # and JSON Schema definitions
+        self._content_types = tuple(
+            name for name, info in self.types.items()
+            if info.get('elements') or info.get('attributes')
+        )
+        # Shared {"@id": iri} reference nodes, see _id_ref
+        self._id_refs = {}
+        # Type-dependent parts of SHACL/JSON Schema properties, by property type
+        self._shape_type_cache = {}
+        self._json_type_cache = {}
+        # Coerced enum values by (id of the enum_values dict, numeric), see _coerce_enum
+        self._enum_cache = {}
     
     def generate_jsonld_context(self, include_docs=True, include_enums=True, 
                                include_schema=True, shacl_file_url=None):
@@ -30,22 +248,11 @@ class XSDGenerator:
             include_schema: If True, include properties in the context (RDF relationships are not included in context)
             shacl_file_url: Optional URL to SHACL shapes file (for validator discovery)
         """
-        context = {
-            "@context": {
-                "@vocab": self.base_uri,
-                "xsd": "http://www.w3.org/2001/XMLSchema#",
-                "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
-                "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
-                "owl": "http://www.w3.org/2002/07/owl#"
-            }
-        }
+        context = self._new_jsonld_context(shacl_file_url)
+        terms = context["@context"]
         
-        # Add SHACL shapes link if provided
-        if shacl_file_url:
-            context["@shacl"] = shacl_file_url
-        
-        # Track properties by their owning type
-        properties_by_type = {}
+        # Property names in type order, added after all type terms
+        property_names = []
         
         # Add all types to context
         # Use relative IRIs since @vocab is set - just "@id" string instead of full object
@@ -53,416 +260,424 @@ class XSDGenerator:
             # Note: RDF relationships (rdfs:subClassOf, rdfs:comment, @enum, etc.) are not valid in JSON-LD context
             # They belong in the JSON-LD schema file instead
             # Using relative IRI shorthand: "@id" since term is in @vocab namespace
-            context["@context"][type_name] = "@id"
+            terms[type_name] = "@id"
             
             # Track properties for this type
             if include_schema:
-                properties_by_type[type_name] = []
-                # Add elements as properties
-                for elem in type_info.get('elements', []):
-                    properties_by_type[type_name].append({
-                        'name': elem['name'],
-                        'type': elem.get('type'),
-                        'documentation': elem.get('documentation')
-                    })
-                # Add attributes as properties
-                for attr in type_info.get('attributes', []):
-                    properties_by_type[type_name].append({
-                        'name': attr['name'],
-                        'type': attr.get('type'),
-                        'default': attr.get('default'),
-                        'documentation': attr.get('documentation')
-                    })
+                property_names.extend(self._property_names(type_info))
+        
+        self._add_context_terms(context, property_names)
+        return context
+    
+    def _new_jsonld_context(self, shacl_file_url=None):
+        """Create the JSON-LD context document with its prefixes."""
+        context = {
+            "@context": {"@vocab": self.base_uri, **_JSONLD_PREFIXES}
+        }
+        
+        # Add SHACL shapes link if provided
+        if shacl_file_url:
+            context["@shacl"] = shacl_file_url
+        
+        return context
+    
+    @staticmethod
+    def _property_names(type_info):
+        """Yield the names of a type's elements, then of its attributes."""
+        for elem in type_info.get('elements', ()):
+            yield elem['name']
+        for attr in type_info.get('attributes', ()):
+            yield attr['name']
+    
+    def _add_context_terms(self, context, property_names):
+        """Add property, element and XSD type terms after the type terms.
+        
+        Terms already defined keep their first definition; setdefault does the
+        membership test and insertion in one lookup.
+        """
+        terms = context["@context"]
         
         # Add properties (without RDF relationships - those belong in schema, not context)
-        if include_schema:
-            for type_name, properties in properties_by_type.items():
-                for prop in properties:
-                    prop_name = prop['name']
-                    if prop_name not in context["@context"]:
-                        # Note: RDF relationships (rdfs:domain, rdfs:range, rdfs:comment, OWL cardinality, @default)
-                        # are not valid in JSON-LD context - they belong in the JSON-LD schema file
-                        # Using relative IRI shorthand: "@id" since term is in @vocab namespace
-                        context["@context"][prop_name] = "@id"
+        # Note: RDF relationships (rdfs:domain, rdfs:range, rdfs:comment, OWL cardinality, @default)
+        # are not valid in JSON-LD context - they belong in the JSON-LD schema file
+        # Using relative IRI shorthand: "@id" since term is in @vocab namespace
+        for prop_name in property_names:
+            terms.setdefault(prop_name, "@id")
         
         # Add all elements to context
-        for elem_name, elem_info in self.elements.items():
-            if elem_name not in context["@context"]:
-                # Note: rdfs:comment is not valid in JSON-LD context term definitions
-                # Documentation belongs in the JSON-LD schema file instead
-                # Using relative IRI shorthand: "@id" since term is in @vocab namespace
-                context["@context"][elem_name] = "@id"
+        # Note: rdfs:comment is not valid in JSON-LD context term definitions
+        # Documentation belongs in the JSON-LD schema file instead
+        for elem_name in self.elements:
+            terms.setdefault(elem_name, "@id")
         
         # Add common XSD types
-        xsd_types = {
-            "string": "xsd:string",
-            "int": "xsd:int",
-            "long": "xsd:long",
-            "boolean": "xsd:boolean",
-            "unsignedByte": "xsd:unsignedByte",
-            "unsignedShort": "xsd:unsignedShort",
-            "unsignedInt": "xsd:unsignedInt",
-            "unsignedLong": "xsd:unsignedLong",
-            "byte": "xsd:byte",
-            "short": "xsd:short",
-            "anyURI": "xsd:anyURI",
-            "hexBinary": "xsd:hexBinary"
-        }
-        
-        for xsd_type, xsd_uri in xsd_types.items():
-            if xsd_type not in context["@context"]:
-                context["@context"][xsd_type] = xsd_uri
-        
-        return context
+        for xsd_type, xsd_uri in _CONTEXT_XSD_TYPES.items():
+            terms.setdefault(xsd_type, xsd_uri)
     
     def generate_jsonld_schema(self, include_docs=True, include_enums=True):
         """Generate JSON-LD schema definitions (RDF/OWL style)."""
-        schema = {
-            "@context": {
-                "@vocab": self.base_uri,
-                "xsd": "http://www.w3.org/2001/XMLSchema#",
-                "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
-                "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
-                "owl": "http://www.w3.org/2002/07/owl#"
-            },
-            "@graph": []
-        }
+        schema = self._new_jsonld_schema()
         
         # Generate schema for each type
         for type_name, type_info in self.types.items():
-            type_node = {
-                "@id": f"{self.base_uri}{type_name}",
-                "@type": "rdfs:Class"
-            }
-            
-            # Add documentation
-            if include_docs and type_info.get('documentation'):
-                type_node["rdfs:comment"] = type_info['documentation']
-            
-            # Add inheritance
-            if type_info.get('base'):
-                base_type = type_info['base'].replace('xs:', '')
-                if base_type in self.types:
-                    type_node["rdfs:subClassOf"] = {
-                        "@id": f"{self.base_uri}{base_type}"
-                    }
-            
-            # Add enum values
-            if include_enums and type_info.get('enum_values'):
-                type_node["@enum"] = type_info['enum_values']
-            
-            schema["@graph"].append(type_node)
+            schema["@graph"].append(
+                self._class_node(type_name, type_info, include_docs, include_enums, self.base_uri)
+            )
         
         return schema
     
-    def generate_shacl_shapes(self, include_docs=True, include_enums=True):
-        """Generate SHACL shapes for validation with RDF ontology information."""
-        shacl = {
-            "@context": {
-                "@vocab": self.base_uri,
-                "sh": "http://www.w3.org/ns/shacl#",
-                "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
-                "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
-                "xsd": "http://www.w3.org/2001/XMLSchema#",
-                "owl": "http://www.w3.org/2002/07/owl#"
-            },
+    def _new_jsonld_schema(self):
+        """Create the JSON-LD schema document with an empty graph."""
+        return {
+            "@context": {"@vocab": self.base_uri, **_JSONLD_PREFIXES},
             "@graph": []
         }
+    
+    def _class_node(self, type_name, type_info, include_docs, include_enums, iri_prefix=''):
+        """Create an rdfs:Class node for a type.
+        
+        Args:
+            iri_prefix: Prefix for the class IRIs ('' for relative IRIs under @vocab)
+        """
+        documentation = type_info.get('documentation')
+        base = type_info.get('base')
+        enum_values = type_info.get('enum_values')
+        
+        class_node = {
+            "@id": f"{iri_prefix}{type_name}",
+            "@type": "rdfs:Class"
+        }
         
-        # Track properties by their owning type for domain information
-        properties_by_type = {}
+        # Add documentation
+        if include_docs and documentation:
+            class_node["rdfs:comment"] = documentation
         
-        # Generate shapes for each type
-        for type_name, type_info in self.types.items():
-            if not type_info.get('elements') and not type_info.get('attributes'):
-                continue
-            
-            # Use relative IRIs since @vocab is set
-            shape = {
-                "@id": f"{type_name}Shape",
-                "@type": "sh:NodeShape",
-                "sh:targetClass": {
-                    "@id": type_name
-                }
-            }
-            
-            if include_docs and type_info.get('documentation'):
-                shape["rdfs:comment"] = type_info['documentation']
-            
-            properties = []
-            properties_by_type[type_name] = []
-            
-            # Add element properties
-            for elem in type_info.get('elements', []):
-                elem_type = elem.get('type', '').replace('xs:', '')
-                enum_values = None
-                enum_ranges = None
-                if elem_type in self.types:
-                    type_info_elem = self.types[elem_type]
-                    enum_values = type_info_elem.get('enum_values')
-                    enum_ranges = type_info_elem.get('enum_ranges')
-                elif elem.get('enum_values'):
-                    enum_values = elem.get('enum_values')
-                    enum_ranges = elem.get('enum_ranges')
-                
-                prop_shape = self._create_property_shape(
-                    elem['name'],
-                    elem.get('type'),
-                    elem.get('minOccurs', '1'),
-                    elem.get('maxOccurs', '1'),
-                    elem.get('documentation') if include_docs else None,
-                    None,
-                    enum_values,
-                    enum_ranges
-                )
-                if prop_shape:
-                    properties.append(prop_shape)
-                    properties_by_type[type_name].append({
-                        'name': elem['name'],
-                        'type': elem.get('type'),
-                        'minOccurs': elem.get('minOccurs', '1'),
-                        'maxOccurs': elem.get('maxOccurs', '1'),
-                        'documentation': elem.get('documentation')
-                    })
-            
-            # Add attribute properties
-            for attr in type_info.get('attributes', []):
-                min_occurs = '1' if attr.get('use') == 'required' else '0'
-                attr_type = attr.get('type', '').replace('xs:', '')
-                enum_values = None
-                enum_ranges = None
-                if attr_type in self.types:
-                    type_info_attr = self.types[attr_type]
-                    enum_values = type_info_attr.get('enum_values')
-                    enum_ranges = type_info_attr.get('enum_ranges')
-                
-                prop_shape = self._create_property_shape(
-                    attr['name'],
-                    attr.get('type'),
-                    min_occurs,
-                    '1',
-                    attr.get('documentation') if include_docs else None,
-                    attr.get('default'),
-                    enum_values,
-                    enum_ranges
-                )
-                if prop_shape:
-                    properties.append(prop_shape)
-                    properties_by_type[type_name].append({
-                        'name': attr['name'],
-                        'type': attr.get('type'),
-                        'minOccurs': min_occurs,
-                        'maxOccurs': '1',
-                        'default': attr.get('default'),
-                        'documentation': attr.get('documentation')
-                    })
-            
-            if properties:
-                shape["sh:property"] = properties
-            
-            shacl["@graph"].append(shape)
+        # Add inheritance (rdfs:subClassOf)
+        if base:
+            base_type = _strip_xs(base)
+            if base_type in self.types:
+                class_node["rdfs:subClassOf"] = self._id_ref(f"{iri_prefix}{base_type}")
         
-        # Add RDF ontology information (classes and properties)
-        # This is valid in SHACL files since they use @graph
+        # Add enum values (copied, since load_xsd shares parsers across calls)
+        if include_enums and enum_values:
+            class_node["@enum"] = dict(enum_values)
+        
+        return class_node
+    
+    def generate_shacl_shapes(self, include_docs=True, include_enums=True, workers=1):
+        """Generate SHACL shapes for validation with RDF ontology information.
+        
+        Args:
+            include_docs: Include documentation/descriptions
+            include_enums: Include enum values in RDF ontology
+            workers: Number of processes used to build node shapes (only for
+                schemas with at least _PARALLEL_MIN_SHAPES content types)
+        """
+        shacl = self._new_shacl()
+        
+        # Node shapes, then RDF ontology information (classes and properties)
+        content_types = self._content_types
+        if workers > 1 and len(content_types) >= _PARALLEL_MIN_SHAPES:
+            shapes, property_nodes = self._build_shacl_shapes_parallel(include_docs, workers)
+        else:
+            shapes, property_nodes = self._build_shacl_shapes(content_types, include_docs)
+        types = self.types
         
         # Add class definitions with inheritance
+        # This is valid in SHACL files since they use @graph
         # Use relative IRIs since @vocab is set
-        for type_name, type_info in self.types.items():
-            class_node = {
-                "@id": type_name,
-                "@type": "rdfs:Class"
-            }
+        class_nodes = [
+            self._class_node(type_name, type_info, include_docs, include_enums)
+            for type_name, type_info in types.items()
+        ]
+        
+        shacl["@graph"] = shapes + class_nodes + property_nodes
+        return shacl
+    
+    def _new_shacl(self):
+        """Create the SHACL document with its prefixes and an empty graph."""
+        return {
+            "@context": {"@vocab": self.base_uri, **_SHACL_PREFIXES},
+            "@graph": []
+        }
+    
+    def _build_shacl_shapes(self, type_names, include_docs):
+        """Build the node shapes and property nodes of the given content types."""
+        shapes = []
+        property_nodes = []
+        types = self.types
+        for type_name in type_names:
+            self._add_shacl_shape(type_name, types[type_name], include_docs,
+                                  shapes, property_nodes)
+        return shapes, property_nodes
+    
+    def _build_shacl_shapes_parallel(self, include_docs, workers):
+        """Build node shapes in a process pool, keeping the serial order.
+        
+        The parser is sent once to each worker, which builds shapes for
+        contiguous chunks of content types with its own generator.
+        """
+        content_types = self._content_types
+        size = max(1, len(content_types) // (workers * 4))
+        chunks = [(content_types[i:i + size], include_docs)
+                  for i in range(0, len(content_types), size)]
+        shapes = []
+        property_nodes = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_shape_worker,
+                                 initargs=(self.parser,)) as executor:
+            for chunk_shapes, chunk_property_nodes in executor.map(_build_shape_chunk, chunks):
+                shapes.extend(chunk_shapes)
+                property_nodes.extend(chunk_property_nodes)
+        return shapes, property_nodes
+    
+    def _add_shacl_shape(self, type_name, type_info, include_docs, shapes, property_nodes):
+        """Append a content type's node shape and its property nodes to the given lists."""
+        shape, properties = self._shacl_shape(type_name, type_info, include_docs)
+        shapes.append(shape)
+        # Add property definitions with domain and range
+        for prop, prop_type, min_occurs, max_occurs in properties:
+            property_nodes.append(self._shacl_property_node(
+                type_name, prop, prop_type, min_occurs, max_occurs, include_docs))
+    
+    def _shacl_shape(self, type_name, type_info, include_docs):
+        """Create the node shape for a type.
+        
+        Returns:
+            tuple: (shape, properties) with a (element/attribute dict, type
+                without xs: prefix, minOccurs, maxOccurs) record per property,
+                used for the type's rdf:Property nodes
+        """
+        type_index = self._type_index
+        
+        # Use relative IRIs since @vocab is set
+        shape = {
+            "@id": f"{type_name}Shape",
+            "@type": "sh:NodeShape",
+            "sh:targetClass": self._id_ref(type_name)
+        }
+        
+        type_doc = type_info.get('documentation')
+        if include_docs and type_doc:
+            shape["rdfs:comment"] = type_doc
+        
+        properties = []
+        # Track properties of this type for domain information
+        property_records = []
+        
+        # Add element properties
+        for elem in type_info.get('elements') or ():
+            elem_name = elem['name']
+            elem_type = _strip_xs(elem.get('type'))
+            min_occurs = elem.get('minOccurs', '1')
+            max_occurs = elem.get('maxOccurs', '1')
+            documentation = elem.get('documentation')
+            enum_values = None
+            enum_ranges = None
+            type_entry = type_index.get(elem_type)
+            if type_entry is not None:
+                enum_values, enum_ranges, _ = type_entry
+            elif elem.get('enum_values'):
+                enum_values = elem.get('enum_values')
+                enum_ranges = elem.get('enum_ranges')
             
-            # Add documentation
-            if include_docs and type_info.get('documentation'):
-                class_node["rdfs:comment"] = type_info['documentation']
+            prop_shape = self._create_property_shape(
+                elem_name,
+                elem_type,
+                min_occurs,
+                max_occurs,
+                documentation if include_docs else None,
+                None,
+                enum_values,
+                enum_ranges
+            )
+            if prop_shape:
+                properties.append(prop_shape)
+                property_records.append((elem, elem_type, min_occurs, max_occurs))
+        
+        # Add attribute properties
+        for attr in type_info.get('attributes') or ():
+            attr_name = attr['name']
+            attr_type = _strip_xs(attr.get('type'))
+            min_occurs = '1' if attr.get('use') == 'required' else '0'
+            default_value = attr.get('default')
+            documentation = attr.get('documentation')
+            enum_values = None
+            enum_ranges = None
+            type_entry = type_index.get(attr_type)
+            if type_entry is not None:
+                enum_values, enum_ranges, _ = type_entry
             
-            # Add inheritance (rdfs:subClassOf)
-            if type_info.get('base'):
-                base_type = type_info['base'].replace('xs:', '')
-                if base_type in self.types:
-                    class_node["rdfs:subClassOf"] = {
-                        "@id": base_type
-                    }
+            prop_shape = self._create_property_shape(
+                attr_name,
+                attr_type,
+                min_occurs,
+                '1',
+                documentation if include_docs else None,
+                default_value,
+                enum_values,
+                enum_ranges
+            )
+            if prop_shape:
+                properties.append(prop_shape)
+                property_records.append((attr, attr_type, min_occurs, '1'))
+        
+        if properties:
+            shape["sh:property"] = properties
+        
+        return shape, property_records
+    
+    def _shacl_property_node(self, type_name, prop, prop_type, min_occurs, max_occurs,
+                             include_docs):
+        """Create the rdf:Property node (domain, range, cardinality) for a property.
+        
+        Args:
+            type_name: Name of the type declaring the property
+            prop: The property's element or attribute dict
+            prop_type: Property type without the xs: prefix
+            min_occurs: minOccurs value ('0'/'1' for attributes)
+            max_occurs: maxOccurs value ('1' for attributes)
+            include_docs: Include documentation
+        """
+        # Use relative IRIs since @vocab is set
+        prop_name = prop['name']
+        prop_node = {
+            "@id": prop_name,
+            "@type": "rdf:Property"
+        }
+        
+        # Add domain (which type this property belongs to)
+        prop_node["rdfs:domain"] = self._id_ref(type_name)
+        
+        # Add range (what type the property value is, without the xs: prefix)
+        if prop_type:
+            if prop_type in self.types:
+                prop_node["rdfs:range"] = self._id_ref(prop_type)
+            elif prop_type in _BUILTIN_XSD_TYPES:
+                prop_node["rdfs:range"] = f"xsd:{prop_type}"
+        
+        # Add documentation
+        documentation = prop.get('documentation')
+        if include_docs and documentation:
+            prop_node["rdfs:comment"] = documentation
+        
+        # Add cardinality constraints using OWL properties
+        min_val = _parse_occurs(min_occurs, 0)
+        if min_val == 0:
+            prop_node["owl:minCardinality"] = 0
+        elif min_val > 1:
+            prop_node["owl:minCardinality"] = min_val
+        
+        if max_occurs != '1':
+            if max_occurs != 'unbounded':
+                max_val = _parse_occurs(max_occurs, 1)
+                if max_val > 1:
+                    prop_node["owl:maxCardinality"] = max_val
+        
+        return prop_node
+    
+    def generate_all(self, include_docs=True, include_enums=True, include_schema=True,
+                     shacl_file_url=None):
+        """Generate the JSON-LD context, JSON-LD schema, SHACL shapes and JSON
+        Schema in a single pass over the types (plus one over the types with
+        elements or attributes, for shapes and definitions).
+        
+        Each output is identical to the one from its own generate_* method.
+        
+        Args:
+            include_docs: Include documentation/descriptions
+            include_enums: Include enum values
+            include_schema: Include properties in the JSON-LD context
+            shacl_file_url: Optional URL to SHACL shapes file (linked from the context)
             
-            # Add enum values
-            if include_enums and type_info.get('enum_values'):
-                class_node["@enum"] = type_info['enum_values']
+        Returns:
+            dict: Outputs keyed 'jsonld_context', 'jsonld_schema', 'shacl' and 'json_schema'
+        """
+        context = self._new_jsonld_context(shacl_file_url)
+        jsonld_schema = self._new_jsonld_schema()
+        shacl = self._new_shacl()
+        json_schema = self._new_json_schema()
+        
+        context_terms = context["@context"]
+        property_names = []
+        schema_graph = jsonld_schema["@graph"]
+        definitions = json_schema["definitions"]
+        shapes = []
+        class_nodes = []
+        property_nodes = []
+        
+        types = self.types
+        for type_name, type_info in types.items():
+            context_terms[type_name] = "@id"
+            if include_schema:
+                property_names.extend(self._property_names(type_info))
             
-            shacl["@graph"].append(class_node)
+            schema_graph.append(
+                self._class_node(type_name, type_info, include_docs, include_enums, self.base_uri)
+            )
+            class_nodes.append(self._class_node(type_name, type_info, include_docs, include_enums))
         
-        # Add property definitions with domain and range
-        # Use relative IRIs since @vocab is set
-        for type_name, properties in properties_by_type.items():
-            for prop in properties:
-                prop_name = prop['name']
-                prop_node = {
-                    "@id": prop_name,
-                    "@type": "rdf:Property"
-                }
-                
-                # Add domain (which type this property belongs to)
-                prop_node["rdfs:domain"] = {
-                    "@id": type_name
-                }
-                
-                # Add range (what type the property value is)
-                prop_type = prop.get('type', '').replace('xs:', '')
-                if prop_type:
-                    if prop_type in self.types:
-                        prop_node["rdfs:range"] = {
-                            "@id": prop_type
-                        }
-                    elif prop_type in ['string', 'int', 'long', 'boolean', 'unsignedByte', 
-                                      'unsignedShort', 'unsignedInt', 'unsignedLong', 
-                                      'byte', 'short', 'anyURI', 'hexBinary']:
-                        prop_node["rdfs:range"] = f"xsd:{prop_type}"
-                
-                # Add documentation
-                if include_docs and prop.get('documentation'):
-                    prop_node["rdfs:comment"] = prop['documentation']
-                
-                # Add cardinality constraints using OWL properties
-                min_occurs = prop.get('minOccurs', '1')
-                max_occurs = prop.get('maxOccurs', '1')
-                
-                min_val = int(min_occurs) if min_occurs.isdigit() else 0
-                if min_val == 0:
-                    prop_node["owl:minCardinality"] = 0
-                elif min_val > 1:
-                    prop_node["owl:minCardinality"] = min_val
-                
-                if max_occurs != '1':
-                    if max_occurs != 'unbounded':
-                        max_val = int(max_occurs) if max_occurs.isdigit() else 1
-                        if max_val > 1:
-                            prop_node["owl:maxCardinality"] = max_val
-                
-                shacl["@graph"].append(prop_node)
+        # Shapes and definitions only exist for types with elements or attributes
+        for type_name in self._content_types:
+            type_info = types[type_name]
+            self._add_shacl_shape(type_name, type_info, include_docs, shapes, property_nodes)
+            definitions[type_name] = self._json_type_schema(type_info, include_docs, include_enums)
         
-        return shacl
+        self._add_context_terms(context, property_names)
+        shacl["@graph"] = shapes + class_nodes + property_nodes
+        
+        return {
+            'jsonld_context': context,
+            'jsonld_schema': jsonld_schema,
+            'shacl': shacl,
+            'json_schema': json_schema
+        }
+    
+    def _id_ref(self, iri):
+        """Get the {"@id": iri} reference node for an IRI.
+        
+        Nodes are shared across the JSON-LD schema and SHACL outputs of this
+        generator (there are a few per property), so treat them as read-only.
+        """
+        ref = self._id_refs.get(iri)
+        if ref is None:
+            ref = self._id_refs[iri] = {"@id": iri}
+        return ref
     
     def _create_property_shape(self, prop_name, prop_type, min_occurs, max_occurs, 
                               documentation=None, default_value=None, enum_values=None, enum_ranges=None):
         """Create a SHACL property shape."""
         # Use relative IRI since @vocab is set
         prop_shape = {
-            "sh:path": {
-                "@id": prop_name
-            }
+            "sh:path": self._id_ref(prop_name)
         }
         
-        # Determine if this is a numeric type for min/max constraints
-        is_numeric = False
-        prop_type_clean = prop_type.replace('xs:', '') if prop_type else ''
-        numeric_types = ['Int8', 'Int16', 'Int32', 'Int48', 'Int64', 
-                       'UInt8', 'UInt16', 'UInt32', 'UInt40', 'UInt48', 'UInt64',
-                       'int', 'long', 'unsignedByte', 'unsignedShort', 
-                       'unsignedInt', 'unsignedLong', 'byte', 'short']
-        
-        if prop_type_clean in numeric_types:
-            is_numeric = True
-        elif prop_type_clean in self.types:
-            type_info = self.types[prop_type_clean]
-            base_type = type_info.get('base') or type_info.get('restriction')
-            if base_type:
-                base_clean = base_type.replace('xs:', '')
-                if base_clean in numeric_types:
-                    is_numeric = True
+        prop_type_clean = _strip_xs(prop_type)
+        is_numeric, type_constraints = self._shape_type_fragment(prop_type_clean)
         
         # Only add enum constraint (sh:in) if there are NO ranges
         # If there are ranges, the type allows any value in the range, so we shouldn't restrict with sh:in
         if enum_values and not enum_ranges:
-            enum_list = []
-            for key, desc in enum_values.items():
-                if is_numeric:
-                    try:
-                        enum_list.append(int(key))
-                    except:
-                        enum_list.append(key)
-                else:
-                    enum_list.append(key)
+            if is_numeric:
+                # Coerced as in the JSON Schema enum
+                enum_list = [_int_or_str(key) for key in enum_values]
+            else:
+                enum_list = list(enum_values.keys())
             
             if enum_list:
                 prop_shape["sh:in"] = enum_list
         
         # Add cardinality
-        min_val = int(min_occurs) if min_occurs.isdigit() else 0
+        min_val = _parse_occurs(min_occurs, 0)
         if min_val > 0:
             prop_shape["sh:minCount"] = min_val
         
         if max_occurs != 'unbounded':
-            max_val = int(max_occurs) if max_occurs.isdigit() else 1
+            max_val = _parse_occurs(max_occurs, 1)
             if max_val > 0:
                 prop_shape["sh:maxCount"] = max_val
         
-        # Add min/max constraints for integer types (when there are ranges or no enum constraint)
-        if is_numeric:
-            # Check base type if prop_type_clean is a complex type
-            base_type_for_constraints = prop_type_clean
-            if prop_type_clean in self.types:
-                type_info = self.types[prop_type_clean]
-                base_type = type_info.get('base') or type_info.get('restriction')
-                if base_type:
-                    base_type_for_constraints = base_type.replace('xs:', '')
-            
-            if 'UInt8' in base_type_for_constraints or base_type_for_constraints == 'unsignedByte':
-                prop_shape["sh:minInclusive"] = 0
-                prop_shape["sh:maxInclusive"] = 255
-            elif 'UInt16' in base_type_for_constraints or base_type_for_constraints == 'unsignedShort':
-                prop_shape["sh:minInclusive"] = 0
-                prop_shape["sh:maxInclusive"] = 65535
-            elif 'UInt32' in base_type_for_constraints or base_type_for_constraints == 'unsignedInt':
-                prop_shape["sh:minInclusive"] = 0
-                prop_shape["sh:maxInclusive"] = 4294967295
-        
-        # Add datatype or node
-        if prop_type:
-            prop_type_clean = prop_type.replace('xs:', '')
-            xsd_type_map = {
-                'string': 'xsd:string',
-                'int': 'xsd:integer',
-                'long': 'xsd:long',
-                'boolean': 'xsd:boolean',
-                'unsignedByte': 'xsd:unsignedByte',
-                'unsignedShort': 'xsd:unsignedShort',
-                'unsignedInt': 'xsd:unsignedInt',
-                'unsignedLong': 'xsd:unsignedLong',
-                'byte': 'xsd:byte',
-                'short': 'xsd:short',
-                'anyURI': 'xsd:anyURI',
-                'hexBinary': 'xsd:hexBinary'
-            }
-            
-            if prop_type_clean in xsd_type_map:
-                prop_shape["sh:datatype"] = xsd_type_map[prop_type_clean]
-            elif prop_type_clean in self.types:
-                type_info = self.types[prop_type_clean]
-                has_elements = bool(type_info.get('elements'))
-                has_attributes = bool(type_info.get('attributes'))
-                
-                if has_elements or has_attributes:
-                    # Use relative IRI since @vocab is set
-                    prop_shape["sh:node"] = {
-                        "@id": f"{prop_type_clean}Shape"
-                    }
-                else:
-                    base_type = type_info.get('base') or type_info.get('restriction')
-                    if base_type:
-                        base_clean = base_type.replace('xs:', '')
-                        if base_clean in xsd_type_map:
-                            prop_shape["sh:datatype"] = xsd_type_map[base_clean]
-                        elif 'Int' in base_clean or 'UInt' in base_clean:
-                            prop_shape["sh:datatype"] = "xsd:integer"
-                        elif 'String' in base_clean:
-                            prop_shape["sh:datatype"] = "xsd:string"
-                        else:
-                            prop_shape["sh:datatype"] = "xsd:string"
-            else:
-                if 'Int' in prop_type_clean or 'UInt' in prop_type_clean:
-                    prop_shape["sh:datatype"] = "xsd:integer"
-                elif 'String' in prop_type_clean:
-                    prop_shape["sh:datatype"] = "xsd:string"
+        # Add min/max constraints and datatype or node
+        prop_shape.update(type_constraints)
         
         if documentation:
             prop_shape["rdfs:comment"] = documentation
@@ -472,100 +687,176 @@ class XSDGenerator:
         
         return prop_shape
     
+    def _shape_type_fragment(self, prop_type_clean):
+        """Get the type-dependent part of a SHACL property shape (cached per type).
+        
+        Returns:
+            tuple: (is_numeric, constraints) where constraints holds
+                sh:minInclusive/sh:maxInclusive and sh:datatype or sh:node,
+                in output order. Shared between shapes, so treat as read-only.
+        """
+        cached = self._shape_type_cache.get(prop_type_clean)
+        if cached is not None:
+            return cached
+        
+        constraints = {}
+        type_info = self.types.get(prop_type_clean)
+        base_clean = None
+        if type_info is not None:
+            base_type = type_info.get('base') or type_info.get('restriction')
+            if base_type:
+                base_clean = _strip_xs(base_type)
+        
+        # Determine if this is a numeric type for min/max constraints
+        is_numeric = prop_type_clean in _NUMERIC_TYPES or base_clean in _NUMERIC_TYPES
+        
+        # Add min/max constraints for integer types (when there are ranges or no enum constraint)
+        if is_numeric:
+            # Check base type if prop_type_clean is a complex type
+            bounds = _integer_bounds(base_clean if base_clean is not None else prop_type_clean)
+            if bounds:
+                constraints["sh:minInclusive"], constraints["sh:maxInclusive"] = bounds
+        
+        # Add datatype or node
+        if prop_type_clean in _XSD_DATATYPES:
+            constraints["sh:datatype"] = _XSD_DATATYPES[prop_type_clean]
+        elif type_info is not None:
+            if type_info.get('elements') or type_info.get('attributes'):
+                # Use relative IRI since @vocab is set
+                constraints["sh:node"] = self._id_ref(f"{prop_type_clean}Shape")
+            elif base_clean is not None:
+                if base_clean in _XSD_DATATYPES:
+                    constraints["sh:datatype"] = _XSD_DATATYPES[base_clean]
+                elif _name_kind(base_clean) == 'integer':
+                    constraints["sh:datatype"] = "xsd:integer"
+                else:
+                    constraints["sh:datatype"] = "xsd:string"
+        else:
+            kind = _name_kind(prop_type_clean)
+            if kind == 'integer':
+                constraints["sh:datatype"] = "xsd:integer"
+            elif kind == 'string':
+                constraints["sh:datatype"] = "xsd:string"
+        
+        result = self._shape_type_cache[prop_type_clean] = (is_numeric, constraints)
+        return result
+    
     def generate_json_schema(self, include_docs=True, include_enums=True):
         """Generate JSON Schema (for OpenAPI/JSON validation)."""
-        schema = {
+        schema = self._new_json_schema()
+        
+        schema["definitions"] = dict(self.iter_json_schema_definitions(include_docs, include_enums))
+        return schema
+    
+    def iter_json_schema_definitions(self, include_docs=True, include_enums=True):
+        """Yield JSON Schema definitions one type at a time.
+        
+        Lets callers stream large schemas instead of holding all definitions,
+        e.g. write each pair with json.dumps as it is produced.
+        
+        Yields:
+            tuple: (type_name, definition) for each type with elements or attributes
+        """
+        types = self.types
+        for type_name in self._content_types:
+            yield type_name, self._json_type_schema(types[type_name], include_docs, include_enums)
+    
+    def _new_json_schema(self):
+        """Create the JSON Schema document with empty definitions."""
+        return {
             "$schema": "http://json-schema.org/draft-07/schema#",
             "$id": f"{self.base_uri}schema.json",
             "title": "IEEE 2030.5 Schema",
             "description": "JSON Schema generated from IEEE 2030.5 XSD",
             "definitions": {}
         }
+    
+    def _json_type_schema(self, type_info, include_docs, include_enums):
+        """Create the object schema for a type with elements or attributes."""
+        elements = type_info.get('elements') or ()
+        attributes = type_info.get('attributes') or ()
         
-        # Generate schemas for each type
-        for type_name, type_info in self.types.items():
-            if not type_info.get('elements') and not type_info.get('attributes'):
-                continue
-            
-            type_schema = {
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-            
-            if include_docs and type_info.get('documentation'):
-                type_schema["description"] = type_info['documentation']
-            
-            # Add properties from elements
-            for elem in type_info.get('elements', []):
-                enum_values = elem.get('enum_values')
-                enum_ranges = elem.get('enum_ranges')
-                if enum_values is None or enum_ranges is None:
-                    elem_type = elem.get('type', '').replace('xs:', '')
-                    if include_enums and elem_type in self.types:
-                        type_info_elem = self.types[elem_type]
-                        if enum_values is None:
-                            enum_values = type_info_elem.get('enum_values')
-                        if enum_ranges is None:
-                            enum_ranges = type_info_elem.get('enum_ranges')
-                
-                # Get type documentation for bitmask detection
-                elem_type = elem.get('type', '').replace('xs:', '')
-                type_doc = None
-                if elem_type in self.types:
-                    type_doc = self.types[elem_type].get('documentation', '')
-                
-                prop_schema = self._create_json_schema_property(
-                    elem.get('type'),
-                    elem.get('minOccurs', '1'),
-                    elem.get('maxOccurs', '1'),
-                    elem.get('documentation') if include_docs else None,
-                    include_enums,
-                    None,
-                    enum_values,
-                    type_documentation=type_doc,
-                    enum_ranges=enum_ranges
-                )
-                if prop_schema:
-                    type_schema["properties"][elem['name']] = prop_schema
-                    if elem.get('minOccurs', '1') == '1':
-                        type_schema["required"].append(elem['name'])
+        type_index = self._type_index
+        
+        type_schema = {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+        
+        documentation = type_info.get('documentation')
+        if include_docs and documentation:
+            type_schema["description"] = documentation
+        properties = type_schema["properties"]
+        required = type_schema["required"]
+        
+        # Add properties from elements
+        for elem in elements:
+            elem_name = elem['name']
+            min_occurs = elem.get('minOccurs', '1')
+            enum_values = elem.get('enum_values')
+            enum_ranges = elem.get('enum_ranges')
+            elem_type = _strip_xs(elem.get('type'))
+            type_entry = type_index.get(elem_type)
+            # Type documentation is used for bitmask detection
+            type_doc = None
+            if type_entry is not None:
+                type_enum_values, type_enum_ranges, type_doc = type_entry
+                if include_enums:
+                    if enum_values is None:
+                        enum_values = type_enum_values
+                    if enum_ranges is None:
+                        enum_ranges = type_enum_ranges
             
-            # Add properties from attributes
-            for attr in type_info.get('attributes', []):
-                min_occurs = '1' if attr.get('use') == 'required' else '0'
-                attr_type = attr.get('type', '').replace('xs:', '')
-                enum_values = None
-                enum_ranges = None
-                if include_enums and attr_type in self.types:
-                    type_info_attr = self.types[attr_type]
-                    enum_values = type_info_attr.get('enum_values')
-                    enum_ranges = type_info_attr.get('enum_ranges')
-                
-                # Get type documentation for bitmask detection
-                type_doc = None
-                if attr_type in self.types:
-                    type_doc = self.types[attr_type].get('documentation', '')
-                
-                prop_schema = self._create_json_schema_property(
-                    attr.get('type'),
-                    min_occurs,
-                    '1',
-                    attr.get('documentation') if include_docs else None,
-                    include_enums,
-                    attr.get('default'),
-                    enum_values,
-                    type_documentation=type_doc,
-                    enum_ranges=enum_ranges
-                )
-                if prop_schema:
-                    type_schema["properties"][attr['name']] = prop_schema
-                    if min_occurs == '1':
-                        type_schema["required"].append(attr['name'])
+            prop_schema = self._create_json_schema_property(
+                elem_type,
+                min_occurs,
+                elem.get('maxOccurs', '1'),
+                elem.get('documentation') if include_docs else None,
+                include_enums,
+                None,
+                enum_values,
+                type_documentation=type_doc,
+                enum_ranges=enum_ranges
+            )
+            if prop_schema:
+                properties[elem_name] = prop_schema
+                if min_occurs == '1':
+                    required.append(elem_name)
+        
+        # Add properties from attributes
+        for attr in attributes:
+            attr_name = attr['name']
+            min_occurs = '1' if attr.get('use') == 'required' else '0'
+            attr_type = _strip_xs(attr.get('type'))
+            enum_values = None
+            enum_ranges = None
+            type_entry = type_index.get(attr_type)
+            # Type documentation is used for bitmask detection
+            type_doc = None
+            if type_entry is not None:
+                type_enum_values, type_enum_ranges, type_doc = type_entry
+                if include_enums:
+                    enum_values = type_enum_values
+                    enum_ranges = type_enum_ranges
             
-            schema["definitions"][type_name] = type_schema
+            prop_schema = self._create_json_schema_property(
+                attr_type,
+                min_occurs,
+                '1',
+                attr.get('documentation') if include_docs else None,
+                include_enums,
+                attr.get('default'),
+                enum_values,
+                type_documentation=type_doc,
+                enum_ranges=enum_ranges
+            )
+            if prop_schema:
+                properties[attr_name] = prop_schema
+                if min_occurs == '1':
+                    required.append(attr_name)
         
-        return schema
+        return type_schema
     
     def _create_json_schema_property(self, prop_type, min_occurs, max_occurs, 
                                      documentation=None, include_enums=True, 
@@ -575,71 +866,21 @@ class XSDGenerator:
         if not prop_type:
             return None
         
-        prop_type_clean = prop_type.replace('xs:', '')
+        prop_type_clean = _strip_xs(prop_type)
         prop_schema = {}
         
-        xsd_to_json_type = {
-            'string': 'string',
-            'int': 'integer',
-            'long': 'integer',
-            'boolean': 'boolean',
-            'unsignedByte': 'integer',
-            'unsignedShort': 'integer',
-            'unsignedInt': 'integer',
-            'unsignedLong': 'integer',
-            'byte': 'integer',
-            'short': 'integer',
-            'anyURI': 'string',
-            'hexBinary': 'string'
-        }
-        
-        json_type = None
-        if prop_type_clean in xsd_to_json_type:
-            json_type = xsd_to_json_type[prop_type_clean]
-        elif prop_type_clean in self.types:
-            type_info = self.types[prop_type_clean]
-            has_elements = bool(type_info.get('elements'))
-            has_attributes = bool(type_info.get('attributes'))
-            
-            if has_elements or has_attributes:
-                prop_schema["$ref"] = f"#/definitions/{prop_type_clean}"
-                if documentation:
-                    prop_schema["description"] = documentation
-                if default_value:
-                    prop_schema["default"] = default_value
-                return prop_schema
-            else:
-                base_type = type_info.get('base') or type_info.get('restriction')
-                if base_type:
-                    base_clean = base_type.replace('xs:', '')
-                    if base_clean in xsd_to_json_type:
-                        json_type = xsd_to_json_type[base_clean]
-                        # Check for hexBinary format
-                        if base_clean == 'hexBinary' or 'HexBinary' in base_clean:
-                            prop_schema["format"] = "hexBinary"
-                    elif 'Int' in base_clean or 'UInt' in base_clean:
-                        json_type = 'integer'
-                        # Add format based on integer type
-                        format_value = self._get_integer_format(base_clean)
-                        if format_value:
-                            prop_schema["format"] = format_value
-                    elif 'String' in base_clean:
-                        json_type = 'string'
-                    elif 'HexBinary' in base_clean:
-                        json_type = 'string'
-                        prop_schema["format"] = "hexBinary"
-        elif 'Int' in prop_type_clean or 'UInt' in prop_type_clean:
-            json_type = 'integer'
-            # Add format based on integer type
-            format_value = self._get_integer_format(prop_type_clean)
-            if format_value:
-                prop_schema["format"] = format_value
-        elif 'String' in prop_type_clean:
-            json_type = 'string'
-        elif 'HexBinary' in prop_type_clean:
-            json_type = 'string'
-            prop_schema["format"] = "hexBinary"
+        type_fragment = self._json_type_fragment(prop_type_clean)
+        if type_fragment['ref']:
+            prop_schema["$ref"] = f"#/definitions/{prop_type_clean}"
+            if documentation:
+                prop_schema["description"] = documentation
+            if default_value:
+                prop_schema["default"] = default_value
+            return prop_schema
         
+        json_type = type_fragment['type']
+        if type_fragment['format']:
+            prop_schema["format"] = type_fragment['format']
         if json_type:
             prop_schema["type"] = json_type
         
@@ -657,19 +898,15 @@ class XSDGenerator:
         if enum_values:
             if is_bitmask:
                 # This is a bitmask - don't use enum constraint, document bit positions instead
-                bit_positions = {}
-                for key, desc in enum_values.items():
-                    try:
-                        bit_pos = int(key)
-                        bit_positions[bit_pos] = desc
-                    except:
-                        bit_positions[key] = desc
+                bit_positions = {_int_or_str(key): desc for key, desc in enum_values.items()}
                 
                 # Add bit position documentation
-                bit_desc_text = "\n\nBit positions (multiple bits can be set, value is hex-encoded):\n"
-                for bit_pos in sorted(bit_positions.keys(), key=lambda x: int(x) if isinstance(x, str) and x.isdigit() else 999):
-                    bit_desc_text += f"  - Bit {bit_pos}: {bit_positions[bit_pos]}\n"
-                bit_desc_text += "\nExample: To set bits 0 and 1, use hex value \"00000003\" (0x00000001 | 0x00000002)"
+                # Listed in documentation order
+                bit_desc_lines = ["\n\nBit positions (multiple bits can be set, value is hex-encoded):"]
+                bit_desc_lines.extend(f"  - Bit {bit_pos}: {bit_desc}"
+                                      for bit_pos, bit_desc in bit_positions.items())
+                bit_desc_lines.append("\nExample: To set bits 0 and 1, use hex value \"00000003\" (0x00000001 | 0x00000002)")
+                bit_desc_text = "\n".join(bit_desc_lines)
                 
                 if documentation:
                     prop_schema["description"] = documentation + bit_desc_text
@@ -680,99 +917,52 @@ class XSDGenerator:
                 prop_schema["x-bit-positions"] = bit_positions
                 
                 # Add pattern for hexBinary validation based on base type
-                hex_binary_size = None
-                if prop_type_clean in self.types:
-                    type_info = self.types[prop_type_clean]
-                    base_type = type_info.get('base') or type_info.get('restriction')
-                    if base_type:
-                        base_clean = base_type.replace('xs:', '')
-                        if 'HexBinary32' in base_clean:
-                            hex_binary_size = 32
-                        elif 'HexBinary16' in base_clean:
-                            hex_binary_size = 16
-                        elif 'HexBinary8' in base_clean:
-                            hex_binary_size = 8
-                        elif 'HexBinary64' in base_clean:
-                            hex_binary_size = 64
-                        elif 'HexBinary160' in base_clean:
-                            hex_binary_size = 160
-                        elif 'HexBinary48' in base_clean:
-                            hex_binary_size = 48
-                
+                hex_binary_size = type_fragment['hex_binary_size']
                 if hex_binary_size:
-                    # Pattern: 1 to N/4 hex characters (since each hex char is 4 bits)
-                    max_chars = hex_binary_size // 4
-                    prop_schema["pattern"] = f"^[0-9A-Fa-f]{{1,{max_chars}}}$"
-                    prop_schema["x-examples"] = [
-                        "00000001",  # Only bit 0 set (for 32-bit)
-                        "00000003",  # Bits 0 and 1 set
-                        "FFFFFFFF" if hex_binary_size >= 32 else "FF"  # All bits set
-                    ]
+                    prop_schema["pattern"] = _HEX_BINARY_PATTERNS[hex_binary_size]
+                    # A fresh list per property (shared lists become YAML aliases)
+                    prop_schema["x-examples"] = list(_HEX_BINARY_EXAMPLES[hex_binary_size])
             else:
                 # Regular enum (not a bitmask)
-                enum_list = []
-                enum_descriptions = {}  # Store descriptions for each enum value
-                is_numeric = json_type == 'integer' if json_type else False
-                if not is_numeric and prop_type_clean in self.types:
-                    type_info = self.types[prop_type_clean]
-                    base_type = type_info.get('base') or type_info.get('restriction')
-                    if base_type:
-                        base_clean = base_type.replace('xs:', '')
-                        if base_clean in ['unsignedByte', 'unsignedShort', 'unsignedInt', 'unsignedLong',
-                                         'byte', 'short', 'int', 'long'] or 'Int' in base_clean or 'UInt' in base_clean:
-                            is_numeric = True
-                    elif 'Int' in prop_type_clean or 'UInt' in prop_type_clean:
-                        is_numeric = True
-                
-                for key, desc in enum_values.items():
-                    enum_value = key
-                    if is_numeric:
-                        try:
-                            enum_value = int(key)
-                        except:
-                            enum_value = key
-                    enum_list.append(enum_value)
-                    # Store description for this enum value
-                    if desc:
-                        enum_descriptions[str(enum_value)] = desc
+                enum_list, enum_descriptions, specific_values = self._coerce_enum(
+                    enum_values, type_fragment['numeric_enum'])
                 
                 # Only add enum constraint if there are NO ranges
                 # If there are ranges, the type allows any value in the range, so we shouldn't restrict with enum
                 if enum_list and not enum_ranges:
-                    prop_schema["enum"] = enum_list
+                    # A fresh list per property (shared lists become YAML aliases)
+                    prop_schema["enum"] = list(enum_list)
                 
                 # Always add enum descriptions and ranges to x-enum-descriptions for documentation
                 if enum_descriptions or enum_ranges:
-                    if "x-enum-descriptions" not in prop_schema:
-                        prop_schema["x-enum-descriptions"] = {}
+                    x_enum_descriptions = prop_schema.setdefault("x-enum-descriptions", {})
                     
                     # Add specific enum value descriptions
                     if enum_descriptions:
-                        prop_schema["x-enum-descriptions"].update(enum_descriptions)
+                        x_enum_descriptions.update(enum_descriptions)
                     
                     # Add range descriptions
                     if enum_ranges:
                         for range_info in enum_ranges:
                             range_key = f"{range_info['start']} - {range_info['end']}"
-                            prop_schema["x-enum-descriptions"][range_key] = range_info['description']
+                            x_enum_descriptions[range_key] = range_info['description']
                     
                     # Also add to description for better visibility
                     if enum_descriptions or enum_ranges:
                         enum_desc_lines = []
                         # Only show specific enum values (not ranges) in Enum values section
                         if enum_descriptions:
-                            # Filter out range keys (those containing " - ")
-                            specific_values = {k: v for k, v in enum_descriptions.items() if " - " not in k}
                             if specific_values:
                                 enum_desc_lines.append("Enum values:")
-                                for k, v in specific_values.items():
-                                    enum_desc_lines.append(f"  - {k}: {v}")
+                                enum_desc_lines.extend(f"  - {k}: {v}" for k, v in specific_values.items())
                         if enum_ranges:
                             if enum_descriptions:
                                 enum_desc_lines.append("")  # Add blank line between specific values and ranges
                             enum_desc_lines.append("Value ranges:")
-                            for range_info in enum_ranges:
-                                enum_desc_lines.append(f"  - {range_info['start']} - {range_info['end']}: {range_info['description']}")
+                            enum_desc_lines.extend(
+                                f"  - {range_info['start']} - {range_info['end']}: {range_info['description']}"
+                                for range_info in enum_ranges
+                            )
                         
                         enum_desc_text = "\n" + "\n".join(enum_desc_lines) if enum_desc_lines else ""
                         if documentation:
@@ -781,37 +971,22 @@ class XSDGenerator:
                             prop_schema["description"] = enum_desc_text.strip()
         
         # Add constraints
-        if json_type == 'integer':
-            # Check base type if prop_type_clean is a complex type
-            base_type_for_constraints = prop_type_clean
-            if prop_type_clean in self.types:
-                type_info = self.types[prop_type_clean]
-                base_type = type_info.get('base') or type_info.get('restriction')
-                if base_type:
-                    base_type_for_constraints = base_type.replace('xs:', '')
-            
-            if 'UInt8' in base_type_for_constraints or base_type_for_constraints == 'unsignedByte':
-                prop_schema["minimum"] = 0
-                prop_schema["maximum"] = 255
-            elif 'UInt16' in base_type_for_constraints or base_type_for_constraints == 'unsignedShort':
-                prop_schema["minimum"] = 0
-                prop_schema["maximum"] = 65535
-            elif 'UInt32' in base_type_for_constraints or base_type_for_constraints == 'unsignedInt':
-                prop_schema["minimum"] = 0
-                prop_schema["maximum"] = 4294967295
-        
-        # Handle arrays
-        if max_occurs == 'unbounded' or (max_occurs.isdigit() and int(max_occurs) > 1):
-            array_schema = {
-                "type": "array",
-                "items": prop_schema
-            }
-            min_items = int(min_occurs) if min_occurs.isdigit() else 0
-            if min_items > 0:
-                array_schema["minItems"] = min_items
-            if max_occurs.isdigit():
-                array_schema["maxItems"] = int(max_occurs)
-            prop_schema = array_schema
+        if type_fragment['bounds']:
+            prop_schema["minimum"], prop_schema["maximum"] = type_fragment['bounds']
+        
+        # Handle arrays (maxOccurs and minOccurs are parsed once, and only
+        # for properties that may repeat)
+        if max_occurs != '1':
+            max_val = _parse_occurs(max_occurs, None)
+            if max_occurs == 'unbounded' or (max_val is not None and max_val > 1):
+                array_schema = _ARRAY_TEMPLATE.copy()
+                array_schema["items"] = prop_schema
+                min_items = _parse_occurs(min_occurs, 0)
+                if min_items > 0:
+                    array_schema["minItems"] = min_items
+                if max_val is not None:
+                    array_schema["maxItems"] = max_val
+                prop_schema = array_schema
         
         # Only set description if it hasn't been set already (e.g., by bitmask or enum handling)
         if documentation and "description" not in prop_schema:
@@ -822,33 +997,175 @@ class XSDGenerator:
         
         return prop_schema if prop_schema else None
     
+    def _coerce_enum(self, enum_values, is_numeric):
+        """Get the JSON Schema enum values and their descriptions for an enum.
+        
+        The enum_values dicts belong to the parsed types and elements, so the
+        result is memoized per dict and shared by every property using it.
+        
+        Args:
+            enum_values: Enum value -> description mapping
+            is_numeric: Convert the values to integers where possible
+        
+        Returns:
+            tuple: (tuple of enum values, {str(value): description} for the
+                values that have one, the same without keys that look like
+                ranges for the "Enum values:" description); treat as read-only
+        """
+        cache_key = (id(enum_values), is_numeric)
+        cached = self._enum_cache.get(cache_key)
+        if cached is not None and cached[0] is enum_values:
+            return cached[1:]
+        
+        enum_list = []
+        enum_descriptions = {}  # Store descriptions for each enum value
+        for key, desc in enum_values.items():
+            enum_value = _int_or_str(key) if is_numeric else key
+            enum_list.append(enum_value)
+            # Store description for this enum value
+            if desc:
+                enum_descriptions[str(enum_value)] = desc
+        
+        # Filter out range keys (those containing " - ")
+        specific_values = {k: v for k, v in enum_descriptions.items() if " - " not in k}
+        
+        result = (tuple(enum_list), enum_descriptions, specific_values)
+        self._enum_cache[cache_key] = (enum_values,) + result
+        return result
+    
+    def _json_type_fragment(self, prop_type_clean):
+        """Get the type-dependent facts for a JSON Schema property (cached per type).
+        
+        Returns:
+            dict: ref (type has its own definition), type, format,
+                hex_binary_size (bitmask pattern), numeric_enum (enum values
+                are integers) and bounds ((minimum, maximum) or None)
+        """
+        cached = self._json_type_cache.get(prop_type_clean)
+        if cached is not None:
+            return cached
+        
+        fragment = {
+            'ref': False,
+            'type': None,
+            'format': None,
+            'hex_binary_size': None,
+            'numeric_enum': False,
+            'bounds': None
+        }
+        self._json_type_cache[prop_type_clean] = fragment
+        
+        type_info = self.types.get(prop_type_clean)
+        base_clean = None
+        if type_info is not None:
+            if prop_type_clean not in _XSD_TO_JSON and (type_info.get('elements') or
+                                                         type_info.get('attributes')):
+                fragment['ref'] = True
+                return fragment
+            base_type = type_info.get('base') or type_info.get('restriction')
+            if base_type:
+                base_clean = _strip_xs(base_type)
+        
+        json_type = None
+        if prop_type_clean in _XSD_TO_JSON:
+            json_type = _XSD_TO_JSON[prop_type_clean]
+        elif type_info is not None:
+            if base_clean is not None:
+                if base_clean in _XSD_TO_JSON:
+                    json_type = _XSD_TO_JSON[base_clean]
+                    # Check for hexBinary format
+                    if base_clean == 'hexBinary':
+                        fragment['format'] = "hexBinary"
+                else:
+                    json_type = self._kind_json_type(_name_kind(base_clean), base_clean, fragment)
+        else:
+            json_type = self._kind_json_type(_name_kind(prop_type_clean), prop_type_clean, fragment)
+        fragment['type'] = json_type
+        
+        # hexBinary size for the bitmask pattern, from the base type
+        if base_clean is not None:
+            fragment['hex_binary_size'] = _hex_binary_size(base_clean)
+        
+        # Whether enum values are converted to integers
+        if json_type == 'integer':
+            fragment['numeric_enum'] = True
+        elif type_info is not None:
+            name = base_clean if base_clean is not None else prop_type_clean
+            fragment['numeric_enum'] = name in _XSD_INTEGER_TYPES or _name_kind(name) == 'integer'
+        
+        # Range constraints for integer types (from the base type if there is one)
+        if json_type == 'integer':
+            fragment['bounds'] = _integer_bounds(base_clean if base_clean is not None else prop_type_clean)
+        
+        return fragment
+    
+    def _kind_json_type(self, kind, type_name, fragment):
+        """Get the JSON type for a named-by-convention type, setting its format."""
+        if kind == 'integer':
+            # Add format based on integer type
+            fragment['format'] = self._get_integer_format(type_name)
+            return 'integer'
+        if kind == 'hexBinary':
+            fragment['format'] = "hexBinary"
+            return 'string'
+        if kind == 'string':
+            return 'string'
+        return None
+    
+    def generate_jsonld_context_bytes(self, **kwargs):
+        """Like generate_jsonld_context, serialized to compact UTF-8 JSON bytes."""
+        return _dumps_bytes(self.generate_jsonld_context(**kwargs))
+    
+    def generate_jsonld_schema_bytes(self, **kwargs):
+        """Like generate_jsonld_schema, serialized to compact UTF-8 JSON bytes."""
+        return _dumps_bytes(self.generate_jsonld_schema(**kwargs))
+    
+    def generate_shacl_shapes_bytes(self, **kwargs):
+        """Like generate_shacl_shapes, serialized to compact UTF-8 JSON bytes."""
+        return _dumps_bytes(self.generate_shacl_shapes(**kwargs))
+    
+    def generate_json_schema_bytes(self, **kwargs):
+        """Like generate_json_schema, serialized to compact UTF-8 JSON bytes."""
+        return _dumps_bytes(self.generate_json_schema(**kwargs))
+    
     def _get_integer_format(self, type_name):
         """Get OpenAPI format string for integer types.
         
         Returns format string (e.g., 'uint8', 'int16') based on XSD type name.
         Returns None for non-standard types (e.g., UInt40, UInt48, Int48).
         """
-        type_lower = type_name.lower()
-        
         # Standard OpenAPI integer formats (from OpenAPI Format Registry)
-        if type_lower == 'uint8' or type_name == 'unsignedByte':
-            return 'uint8'
-        elif type_lower == 'uint16' or type_name == 'unsignedShort':
-            return 'uint16'
-        elif type_lower == 'uint32' or type_name == 'unsignedInt':
-            return 'uint32'
-        elif type_lower == 'uint64' or type_name == 'unsignedLong':
-            return 'uint64'
-        elif type_lower == 'int8' or type_name == 'byte':
-            return 'int8'
-        elif type_lower == 'int16' or type_name == 'short':
-            return 'int16'
-        elif type_lower == 'int32' or type_name == 'int':
-            return 'int32'
-        elif type_lower == 'int64' or type_name == 'long':
-            return 'int64'
+        int_format = _XSD_INT_FORMATS.get(type_name)
+        if int_format is None:
+            int_format = _INT_FORMATS.get(type_name.lower())
         
         # Non-standard types (UInt40, UInt48, Int48) don't have standard OpenAPI formats
         # They will use type: integer with min/max constraints instead
-        return None
+        return int_format
 
+
+# Per-process generator used by _build_shape_chunk, see _init_shape_worker
+_worker_generator = None
+
+
+def _init_shape_worker(parser):
+    """Process-pool initializer: build the worker's generator from the parser."""
+    global _worker_generator
+    _worker_generator = XSDGenerator(parser)
+
+
+def _build_shape_chunk(chunk):
+    """Process-pool worker: build node shapes for a chunk of content types."""
+    type_names, include_docs = chunk
+    return _worker_generator._build_shacl_shapes(type_names, include_docs)
+
+
+def _dumps_bytes(obj):
+    """Serialize obj to compact UTF-8 JSON, keeping key order.
+    
+    Uses orjson when available; the json fallback produces the same bytes.
+    """
+    if HAS_ORJSON:
+        # x-bit-positions uses integer keys
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
@@ -2,12 +2,75 @@
 JSON-LD generators: context, schema, and SHACL shapes.
 """
 
-from converters.core import XSDParser
-from converters.generators import XSDGenerator
+import functools
+import hashlib
+import inspect
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 
+from converters.core import load_xsd, write_cache_file
+from converters.generators import XSDGenerator, _dumps_bytes
 
+__all__ = ['generate_jsonld_context', 'generate_jsonld_schema', 'generate_shacl_shapes',
+           'generate_jsonld_all']
+
+# Outputs of generate_jsonld_all and their file name suffixes
+_JSONLD_OUTPUTS = (
+    ('context', '_context.jsonld'),
+    ('schema', '_schema.jsonld'),
+    ('shacl', '_shacl.jsonld')
+)
+
+# Version of the generated outputs, part of the output cache key (bump when
+# generation changes)
+_OUTPUT_CACHE_VERSION = '1'
+# Arguments that do not change a generated file
+_UNCACHED_ARGUMENTS = ('xsd_file', 'output_file', 'cache_dir', 'workers', 'stream')
+
+
+def _cached_output(func):
+    """Reuse output files across runs when a generate_* function gets cache_dir.
+    
+    Files are cached under <cache_dir>/outputs, keyed by the function, the
+    XSD file's path and mtime, and the remaining arguments. Without an
+    output_file or cache_dir the function runs as usual.
+    """
+    signature = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        arguments = signature.bind(*args, **kwargs)
+        arguments.apply_defaults()
+        arguments = arguments.arguments
+        output_file = arguments['output_file']
+        cache_dir = arguments['cache_dir']
+        if not (output_file and cache_dir):
+            return func(*args, **kwargs)
+        
+        path = os.path.abspath(arguments['xsd_file'])
+        options = sorted((name, value) for name, value in arguments.items()
+                         if name not in _UNCACHED_ARGUMENTS)
+        key = '%s|%s|%s|%r|%s' % (func.__name__, path, os.path.getmtime(path), options,
+                                  _OUTPUT_CACHE_VERSION)
+        cache_file = os.path.join(cache_dir, 'outputs',
+                                  hashlib.blake2b(key.encode('utf-8'), digest_size=20).hexdigest()
+                                  + '.jsonld')
+        if os.path.exists(cache_file):
+            shutil.copyfile(cache_file, output_file)
+            return None
+        
+        result = func(*args, **kwargs)
+        write_cache_file(cache_file, functools.partial(_copy_into, output_file))
+        return result
+    
+    return wrapper
+
+
+@_cached_output
 def generate_jsonld_context(xsd_file, output_file=None, include_docs=True, 
-                           include_enums=True, include_schema=True, shacl_file_url=None):
+                           include_enums=True, include_schema=True, shacl_file_url=None,
+                           cache_dir=None, stream=False):
     """Generate JSON-LD context from XSD file.
     
     Args:
@@ -17,12 +80,15 @@ def generate_jsonld_context(xsd_file, output_file=None, include_docs=True,
         include_enums: Include enum values
         include_schema: Include schema relationships
         shacl_file_url: Optional URL to SHACL shapes file
+        cache_dir: Optional directory for cached parse results and, with an
+            output_file, generated files
+        stream: Write output_file member by member instead of serializing
+            the whole document at once (lower peak memory, same bytes)
         
     Returns:
         dict: JSON-LD context or None if output_file is provided
     """
-    parser = XSDParser()
-    parser.parse(xsd_file)
+    parser = load_xsd(xsd_file, cache_dir=cache_dir)
     generator = XSDGenerator(parser)
     context = generator.generate_jsonld_context(
         include_docs=include_docs,
@@ -32,15 +98,15 @@ def generate_jsonld_context(xsd_file, output_file=None, include_docs=True,
     )
     
     if output_file:
-        import json
-        with open(output_file, 'w') as f:
-            json.dump(context, f, separators=(',', ':'))
+        _write_json(context, output_file, stream)
         return None
     
     return context
 
 
-def generate_jsonld_schema(xsd_file, output_file=None, include_docs=True, include_enums=True):
+@_cached_output
+def generate_jsonld_schema(xsd_file, output_file=None, include_docs=True, include_enums=True,
+                           cache_dir=None, stream=False):
     """Generate JSON-LD schema (RDF/OWL) from XSD file.
     
     Args:
@@ -48,12 +114,15 @@ def generate_jsonld_schema(xsd_file, output_file=None, include_docs=True, includ
         output_file: Optional output file path (if None, returns dict)
         include_docs: Include documentation/descriptions
         include_enums: Include enum values
+        cache_dir: Optional directory for cached parse results and, with an
+            output_file, generated files
+        stream: Write output_file member by member instead of serializing
+            the whole document at once (lower peak memory, same bytes)
         
     Returns:
         dict: JSON-LD schema or None if output_file is provided
     """
-    parser = XSDParser()
-    parser.parse(xsd_file)
+    parser = load_xsd(xsd_file, cache_dir=cache_dir)
     generator = XSDGenerator(parser)
     schema = generator.generate_jsonld_schema(
         include_docs=include_docs,
@@ -61,15 +130,15 @@ def generate_jsonld_schema(xsd_file, output_file=None, include_docs=True, includ
     )
     
     if output_file:
-        import json
-        with open(output_file, 'w') as f:
-            json.dump(schema, f, separators=(',', ':'))
+        _write_json(schema, output_file, stream)
         return None
     
     return schema
 
 
-def generate_shacl_shapes(xsd_file, output_file=None, include_docs=True, include_enums=True):
+@_cached_output
+def generate_shacl_shapes(xsd_file, output_file=None, include_docs=True, include_enums=True,
+                          cache_dir=None, workers=1, stream=False):
     """Generate SHACL shapes from XSD file with RDF ontology information.
     
     Args:
@@ -77,20 +146,138 @@ def generate_shacl_shapes(xsd_file, output_file=None, include_docs=True, include
         output_file: Optional output file path (if None, returns dict)
         include_docs: Include documentation/descriptions
         include_enums: Include enum values in RDF ontology
+        cache_dir: Optional directory for cached parse results and, with an
+            output_file, generated files
+        workers: Number of processes used to build node shapes
+        stream: Write output_file member by member instead of serializing
+            the whole document at once (lower peak memory, same bytes)
         
     Returns:
         dict: SHACL shapes with RDF ontology or None if output_file is provided
     """
-    parser = XSDParser()
-    parser.parse(xsd_file)
+    parser = load_xsd(xsd_file, cache_dir=cache_dir)
     generator = XSDGenerator(parser)
-    shacl = generator.generate_shacl_shapes(include_docs=include_docs, include_enums=include_enums)
+    shacl = generator.generate_shacl_shapes(include_docs=include_docs, include_enums=include_enums,
+                                            workers=workers)
     
     if output_file:
-        import json
-        with open(output_file, 'w') as f:
-            json.dump(shacl, f, separators=(',', ':'))
+        _write_json(shacl, output_file, stream)
         return None
     
     return shacl
 
+
+def generate_jsonld_all(xsd_file, output_dir, include_docs=True, include_enums=True,
+                        include_schema=True, shacl_file_url=None, cache_dir=None, workers=1):
+    """Generate the JSON-LD context, JSON-LD schema and SHACL shapes files from
+    one parse of an XSD file.
+    
+    Files are named after the XSD file, e.g. sep.xsd gives sep_context.jsonld,
+    sep_schema.jsonld and sep_shacl.jsonld. Each is identical to the output of
+    the corresponding generate_* function.
+    
+    Args:
+        xsd_file: Path to XSD file
+        output_dir: Directory for the output files (created if missing; '' for
+            the current directory)
+        include_docs: Include documentation/descriptions
+        include_enums: Include enum values
+        include_schema: Include schema relationships in the context
+        shacl_file_url: Optional URL to SHACL shapes file (linked from the context)
+        cache_dir: Optional directory for cached parse results
+        workers: With more than one, generate and write the three files in
+            separate processes (the parsed schema is sent to each)
+        
+    Returns:
+        dict: Output file paths keyed 'context', 'schema' and 'shacl'
+    """
+    parser = load_xsd(xsd_file, cache_dir=cache_dir)
+    stem = os.path.splitext(os.path.basename(xsd_file))[0]
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    paths = {kind: os.path.join(output_dir, stem + suffix) for kind, suffix in _JSONLD_OUTPUTS}
+    options = {
+        'include_docs': include_docs,
+        'include_enums': include_enums,
+        'include_schema': include_schema,
+        'shacl_file_url': shacl_file_url
+    }
+    
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+            futures = [executor.submit(_write_jsonld_output, parser, kind, path, options)
+                       for kind, path in paths.items()]
+            for future in futures:
+                future.result()
+    else:
+        # One generator, so the outputs share its per-type caches
+        generator = XSDGenerator(parser)
+        for kind, path in paths.items():
+            _write_json(_generate_jsonld_output(generator, kind, options), path)
+    
+    return paths
+
+
+def _generate_jsonld_output(generator, kind, options):
+    """Generate one generate_jsonld_all output ('context', 'schema' or 'shacl')."""
+    include_docs = options['include_docs']
+    include_enums = options['include_enums']
+    if kind == 'context':
+        return generator.generate_jsonld_context(
+            include_docs=include_docs,
+            include_enums=include_enums,
+            include_schema=options['include_schema'],
+            shacl_file_url=options['shacl_file_url']
+        )
+    if kind == 'schema':
+        return generator.generate_jsonld_schema(include_docs=include_docs,
+                                                include_enums=include_enums)
+    return generator.generate_shacl_shapes(include_docs=include_docs, include_enums=include_enums)
+
+
+def _write_jsonld_output(parser, kind, output_file, options):
+    """Process-pool worker: generate one generate_jsonld_all output and write it."""
+    _write_json(_generate_jsonld_output(XSDGenerator(parser), kind, options), output_file)
+
+
+def _copy_into(path, f):
+    """Copy the contents of the file at path into the open binary file f."""
+    with open(path, 'rb') as source:
+        shutil.copyfileobj(source, f)
+
+
+def _write_json(obj, output_file, stream=False):
+    """Write obj to output_file as compact UTF-8 JSON (orjson when available).
+    
+    With stream, only one member of the two outer levels (e.g. one @graph
+    node or one context term) is serialized at a time.
+    """
+    with open(output_file, 'wb', buffering=1 << 20) as f:
+        if stream:
+            _write_json_members(obj, f.write, 2)
+        else:
+            f.write(_dumps_bytes(obj))
+
+
+def _write_json_members(obj, write, depth):
+    """Write obj's members one by one down to depth levels, framing them
+    exactly as _dumps_bytes would."""
+    if depth and obj and isinstance(obj, dict):
+        separator = b'{'
+        for key, value in obj.items():
+            write(separator)
+            # Frame the key as a one-member object so non-string keys (e.g.
+            # None from ref elements) are coerced as in the buffered path
+            write(_dumps_bytes({key: 0})[1:-2])
+            _write_json_members(value, write, depth - 1)
+            separator = b','
+        write(b'}')
+    elif depth and obj and isinstance(obj, list):
+        separator = b'['
+        for item in obj:
+            write(separator)
+            _write_json_members(item, write, depth - 1)
+            separator = b','
+        write(b']')
+    else:
+        write(_dumps_bytes(obj))
@@ -2,13 +2,18 @@
 OpenAPI generator: combines XSD (schemas) and WADL (paths) to generate OpenAPI spec.
 """
 
-from converters.core import XSDParser, WADLParser
+import json
+import os
+import re
+from functools import lru_cache
+
+from converters.core import load_xsd, WADLParser
 from converters.generators import XSDGenerator
 
 # Try to import ruamel.yaml first (preserves comments), fallback to pyyaml
 try:
     from ruamel.yaml import YAML
-    from ruamel.yaml.comments import CommentedMap
+    from ruamel.yaml.comments import CommentedMap, CommentedSeq
     HAS_RUAMEL_YAML = True
     HAS_YAML = True
 except ImportError:
@@ -19,6 +24,124 @@ except ImportError:
     except ImportError:
         HAS_YAML = False
 
+# Prefer orjson (C encoder) for JSON output, fallback to the stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+__all__ = ['generate_openapi_spec']
+
+# JSON Schema and OpenAPI locations of the generated type schemas
+_DEFINITIONS_PREFIX = "#/definitions/"
+_COMPONENTS_PREFIX = "#/components/schemas/"
+
+# YAML comments placed before these keys (x-jsonld-context is added per call)
+_KEY_COMMENTS = {
+    "openapi": "OpenAPI Specification Version",
+    "info": "API Information",
+    "servers": "API Server URLs",
+    "paths": "API Endpoints (from WADL)",
+    "components": "Reusable Components",
+    "schemas": "JSON Schema Definitions (from XSD)",
+    # Comment explaining this extension
+    "x-enum-descriptions": "Enum value descriptions (bit positions and their meanings)"
+}
+
+# WADL methods that become OpenAPI operations, and those with a request body
+_HTTP_METHODS = frozenset(('get', 'post', 'put', 'delete', 'patch', 'head', 'options'))
+_BODY_METHODS = frozenset(('post', 'put', 'patch'))
+
+# XSD integer types of WADL parameters (local names, e.g. xsd:int)
+_XSD_INTEGER_PARAM_TYPES = frozenset((
+    'integer', 'int', 'long', 'short', 'byte',
+    'unsignedInt', 'unsignedLong', 'unsignedShort', 'unsignedByte',
+    'nonNegativeInteger', 'positiveInteger', 'nonPositiveInteger', 'negativeInteger'
+))
+
+# Template parameters ({name}) of a resource path
+_PATH_PARAM_RE = re.compile(r'\{(\w+)\}')
+
+
+@lru_cache(maxsize=8)
+def _shared_generator(parser):
+    """Get the XSDGenerator of a (shared, read-only) parser from load_xsd.
+    
+    Reusing it across calls keeps its per-type caches warm, e.g. when specs
+    are generated for several WADL files against the same XSD. The JSON
+    Schema and context it returns are built fresh on every call.
+    """
+    return XSDGenerator(parser)
+
+
+def _fix_refs(obj):
+    """Point #/definitions/ $refs in obj at #/components/schemas/, in place.
+    
+    Walks nested dicts and lists with an explicit stack instead of recursion;
+    each distinct ref string is rewritten once and reused.
+    """
+    prefix_len = len(_DEFINITIONS_PREFIX)
+    # Rewritten ref by original ref
+    new_refs = {}
+    stack = [obj]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        obj = pop()
+        if isinstance(obj, dict):
+            ref = obj.get("$ref")
+            if ref is not None and ref.startswith(_DEFINITIONS_PREFIX):
+                new_ref = new_refs.get(ref)
+                if new_ref is None:
+                    new_ref = new_refs[ref] = _COMPONENTS_PREFIX + ref[prefix_len:]
+                obj["$ref"] = new_ref
+            extend(obj.values())
+        elif isinstance(obj, list):
+            extend(obj)
+
+
+def _write_json(obj, output_file):
+    """Write obj to output_file as indented UTF-8 JSON.
+    
+    Uses orjson when available; the json fallback writes the same bytes.
+    Non-ASCII text is written as is rather than escaped, and the documents
+    are trees built here, so the circular reference check is skipped.
+    """
+    if HAS_ORJSON:
+        # x-bit-positions uses integer keys
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            f.write(data)
+        return
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        json.dump(obj, f, indent=2, ensure_ascii=False, check_circular=False)
+
+
+def _param_schema_type(param_type):
+    """Get the OpenAPI schema type of a WADL parameter's XSD type (e.g. xsd:int)."""
+    if param_type and param_type.rpartition(':')[2] in _XSD_INTEGER_PARAM_TYPES:
+        return "integer"
+    return "string"
+
+
+def _representation_content(repr_info, schemas):
+    """Get the media type and OpenAPI content entry of a WADL representation.
+    
+    The entry references the representation's element schema if there is
+    one, else it is a generic object.
+    """
+    media_type = repr_info.get('mediaType', 'application/json')
+    element = repr_info.get('element') or ''
+    if element.startswith('sep:'):
+        element = element[4:]
+    
+    if element and element in schemas:
+        content_schema = {"$ref": _COMPONENTS_PREFIX + element}
+    else:
+        content_schema = {"type": "object"}
+    return media_type, {"schema": content_schema}
+
 
 def _enrich_schemas_with_context(schemas, context):
     """Enrich OpenAPI schemas with enum information from JSON-LD context.
@@ -26,49 +149,53 @@ def _enrich_schemas_with_context(schemas, context):
     This adds enum descriptions to schema properties, making it easier
     for developers to understand what enum values mean.
     """
-    def enrich_property(prop_schema, prop_name):
-        """Enrich a single property schema with context information."""
+    # Enum description text for each context term with a non-empty @enum,
+    # built once up front; without any there is nothing to enrich
+    enum_texts = {}
+    for term, term_context in context.items():
+        enum_info = term_context.get("@enum") if isinstance(term_context, dict) else None
+        if enum_info and isinstance(enum_info, dict):
+            enum_text = "\nEnum values:\n" + "\n".join(
+                f"  - {key}: {desc}" for key, desc in enum_info.items()
+            )
+            enum_texts[term] = (enum_text, enum_text.strip())
+    if not enum_texts:
+        return
+    
+    # Walk all schema properties, nested object properties and array items
+    # with an explicit stack of (property name, property schema)
+    stack = []
+    for schema_name, schema in schemas.items():
+        if isinstance(schema, dict) and "properties" in schema:
+            stack.extend(schema["properties"].items())
+    
+    while stack:
+        prop_name, prop_schema = stack.pop()
         if not isinstance(prop_schema, dict):
-            return
+            continue
         
-        # Check if this property has enum values in context
-        if prop_name in context:
-            prop_context = context[prop_name]
-            
-            # If context has @enum, add it to the property description
-            if isinstance(prop_context, dict) and "@enum" in prop_context:
-                enum_info = prop_context["@enum"]
-                if isinstance(enum_info, dict):
-                    # Build enum description
-                    enum_desc = []
-                    for key, desc in enum_info.items():
-                        enum_desc.append(f"  - {key}: {desc}")
-                    
-                    if enum_desc:
-                        existing_desc = prop_schema.get("description", "")
-                        enum_text = "\nEnum values:\n" + "\n".join(enum_desc)
-                        prop_schema["description"] = existing_desc + enum_text if existing_desc else enum_text.strip()
+        # If the property's context term has @enum, add it to the description
+        texts = enum_texts.get(prop_name)
+        if texts is not None:
+            existing_desc = prop_schema.get("description", "")
+            prop_schema["description"] = existing_desc + texts[0] if existing_desc else texts[1]
         
-        # Recursively process nested objects
-        if "properties" in prop_schema:
-            for nested_name, nested_prop in prop_schema["properties"].items():
-                enrich_property(nested_prop, nested_name)
+        # Process nested objects
+        nested_properties = prop_schema.get("properties")
+        if nested_properties is not None:
+            stack.extend(nested_properties.items())
         
         # Process array items
-        if "items" in prop_schema:
-            enrich_property(prop_schema["items"], None)
-    
-    # Process all schemas
-    for schema_name, schema in schemas.items():
-        if isinstance(schema, dict) and "properties" in schema:
-            for prop_name, prop_schema in schema["properties"].items():
-                enrich_property(prop_schema, prop_name)
+        items = prop_schema.get("items")
+        if items is not None:
+            stack.append((None, items))
 
 
 def generate_openapi_spec(xsd_file, wadl_file=None, output_file=None, 
                          api_title="IEEE 2030.5 API", api_version="1.0.0",
                          include_docs=True, include_enums=True,
-                         include_context=False, context_output_file=None):
+                         include_context=False, context_output_file=None,
+                         cache_dir=None, yaml_comments=True):
     """Generate OpenAPI 3.0 specification from XSD and optionally WADL files.
     
     Args:
@@ -81,14 +208,16 @@ def generate_openapi_spec(xsd_file, wadl_file=None, output_file=None,
         include_enums: Include enum values
         include_context: If True, embed JSON-LD context in OpenAPI spec as x-jsonld-context
         context_output_file: Optional path to save context separately (if provided)
+        cache_dir: Optional directory for cached parse results
+        yaml_comments: Add explanatory comments to YAML output (needs ruamel.yaml);
+            False skips building the commented copy of the spec
         
     Returns:
         dict: OpenAPI specification or None if output_file is provided
     """
     # Parse XSD and generate JSON Schema
-    parser = XSDParser()
-    parser.parse(xsd_file)
-    generator = XSDGenerator(parser)
+    parser = load_xsd(xsd_file, cache_dir=cache_dir)
+    generator = _shared_generator(parser)
     
     json_schema = generator.generate_json_schema(
         include_docs=include_docs,
@@ -106,42 +235,26 @@ def generate_openapi_spec(xsd_file, wadl_file=None, output_file=None,
         
         # Save context to separate file if requested
         if context_output_file:
-            import json
-            import os
-            with open(context_output_file, 'w') as f:
-                json.dump(jsonld_context, f, indent=2)
+            _write_json(jsonld_context, context_output_file)
             
             # If context_output_file is provided, we'll reference it instead of embedding
             # Store the relative path for reference
+            context_ref_path = context_output_file
             if output_file:
                 # Calculate relative path from output_file to context_output_file
                 output_dir = os.path.dirname(os.path.abspath(output_file))
                 context_path = os.path.abspath(context_output_file)
                 try:
-                    rel_path = os.path.relpath(context_path, output_dir)
+                    context_ref_path = os.path.relpath(context_path, output_dir)
                 except ValueError:
-                    # If paths are on different drives (Windows), use absolute path
-                    rel_path = context_output_file
-            else:
-                rel_path = context_output_file
+                    # If paths are on different drives (Windows), use the path as given
+                    pass
     
     # Convert definitions to components/schemas and fix $ref paths
     schemas = json_schema.get("definitions", {})
     
     # Fix $ref paths from #/definitions/ to #/components/schemas/
-    def fix_refs(obj):
-        if isinstance(obj, dict):
-            if "$ref" in obj:
-                ref = obj["$ref"]
-                if ref.startswith("#/definitions/"):
-                    obj["$ref"] = ref.replace("#/definitions/", "#/components/schemas/")
-            for value in obj.values():
-                fix_refs(value)
-        elif isinstance(obj, list):
-            for item in obj:
-                fix_refs(item)
-    
-    fix_refs(schemas)
+    _fix_refs(schemas)
     
     # Build OpenAPI spec
     openapi = {
@@ -176,20 +289,9 @@ def generate_openapi_spec(xsd_file, wadl_file=None, output_file=None,
     #   2. A URL/string (reference to external file) - when referencing
     if include_context and jsonld_context:
         if context_output_file:
-            # Reference external context file (x-jsonld-context can be a URL/string)
-            import os
-            if output_file:
-                output_dir = os.path.dirname(os.path.abspath(output_file))
-                context_path = os.path.abspath(context_output_file)
-                try:
-                    rel_path = os.path.relpath(context_path, output_dir)
-                    # Use relative path as URL reference
-                    openapi["x-jsonld-context"] = rel_path
-                except ValueError:
-                    # If paths are on different drives (Windows), use absolute path
-                    openapi["x-jsonld-context"] = context_output_file
-            else:
-                openapi["x-jsonld-context"] = context_output_file
+            # Reference external context file (x-jsonld-context can be a URL/string),
+            # by the path computed when it was written
+            openapi["x-jsonld-context"] = context_ref_path
         else:
             # Embed context directly in OpenAPI spec (x-jsonld-context as object)
             # This follows the IETF standard where x-jsonld-context can be a JSON object
@@ -213,19 +315,22 @@ def generate_openapi_spec(xsd_file, wadl_file=None, output_file=None,
             }]
         
         # Convert WADL resources to OpenAPI paths
+        paths = openapi["paths"]
         for resource in wadl_parser.resources:
             path = resource['path']
-            if not path.startswith('/'):
+            if path[:1] != '/':
                 path = '/' + path
             
             # Initialize path if not exists
-            if path not in openapi["paths"]:
-                openapi["paths"][path] = {}
+            path_item = paths.setdefault(path, {})
+            
+            # Path parameters from the resource path, shared by its methods
+            path_param_matches = _PATH_PARAM_RE.findall(path) if '{' in path else ()
             
             # Convert methods to operations
             for method in resource['methods']:
                 method_name = method['name'].lower()
-                if method_name not in ['get', 'post', 'put', 'delete', 'patch', 'head', 'options']:
+                if method_name not in _HTTP_METHODS:
                     continue
                 
                 operation = {
@@ -239,29 +344,20 @@ def generate_openapi_spec(xsd_file, wadl_file=None, output_file=None,
                     operation["description"] = resource['description']
                 
                 # Add request body for POST, PUT, PATCH
-                if method_name in ['post', 'put', 'patch'] and method.get('request'):
+                if method_name in _BODY_METHODS and method.get('request'):
                     request = method['request']
                     if request.get('representations'):
                         operation["requestBody"] = {
                             "required": True,
                             "content": {}
                         }
+                        content = operation["requestBody"]["content"]
                         for repr_info in request['representations']:
-                            media_type = repr_info.get('mediaType', 'application/json')
-                            element = repr_info.get('element', '').replace('sep:', '')
-                            
-                            content_schema = {}
-                            if element and element in schemas:
-                                content_schema = {"$ref": f"#/components/schemas/{element}"}
-                            else:
-                                content_schema = {"type": "object"}
-                            
-                            operation["requestBody"]["content"][media_type] = {
-                                "schema": content_schema
-                            }
+                            media_type, media_content = _representation_content(repr_info, schemas)
+                            content[media_type] = media_content
                 
-                # Add responses
-                operation["responses"] = {}
+                # Add responses (OpenAPI requires at least one)
+                responses = operation["responses"] = {}
                 if method.get('responses'):
                     for response in method['responses']:
                         status = response.get('status', '200')
@@ -271,60 +367,47 @@ def generate_openapi_spec(xsd_file, wadl_file=None, output_file=None,
                         
                         # Add response content if available
                         if response.get('representations'):
-                            response_def["content"] = {}
+                            content = response_def["content"] = {}
                             for repr_info in response['representations']:
-                                media_type = repr_info.get('mediaType', 'application/json')
-                                element = repr_info.get('element', '').replace('sep:', '')
-                                
-                                content_schema = {}
-                                if element and element in schemas:
-                                    content_schema = {"$ref": f"#/components/schemas/{element}"}
-                                else:
-                                    content_schema = {"type": "object"}
-                                
-                                response_def["content"][media_type] = {
-                                    "schema": content_schema
-                                }
+                                media_type, media_content = _representation_content(repr_info, schemas)
+                                content[media_type] = media_content
                         
-                        operation["responses"][status] = response_def
+                        responses[status] = response_def
                 else:
                     # Default response
-                    operation["responses"]["200"] = {
+                    responses["200"] = {
                         "description": "Success"
                     }
                 
+                # Query and path parameters; only set on the operation if there are any
+                parameters = []
+                
                 # Add query parameters if GET request
                 if method_name == 'get' and method.get('request'):
-                    params = method['request'].get('parameters', [])
-                    if params:
-                        operation["parameters"] = []
-                        for param in params:
-                            param_def = {
-                                "name": param['name'],
-                                "in": param.get('style', 'query'),
-                                "required": param.get('required', False),
-                                "schema": {"type": "integer" if 'int' in param.get('type', '') else "string"}
-                            }
-                            if param.get('description'):
-                                param_def["description"] = param['description']
-                            operation["parameters"].append(param_def)
+                    for param in method['request'].get('parameters', []):
+                        param_def = {
+                            "name": param['name'],
+                            "in": param.get('style', 'query'),
+                            "required": param.get('required', False),
+                            "schema": {"type": _param_schema_type(param.get('type'))}
+                        }
+                        if param.get('description'):
+                            param_def["description"] = param['description']
+                        parameters.append(param_def)
                 
                 # Add path parameters from resource path
-                path_params = []
-                import re
-                path_param_matches = re.findall(r'\{(\w+)\}', path)
-                if path_param_matches:
-                    if "parameters" not in operation:
-                        operation["parameters"] = []
-                    for param_name in path_param_matches:
-                        operation["parameters"].append({
-                            "name": param_name,
-                            "in": "path",
-                            "required": True,
-                            "schema": {"type": "string"}
-                        })
+                for param_name in path_param_matches:
+                    parameters.append({
+                        "name": param_name,
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "string"}
+                    })
                 
-                openapi["paths"][path][method_name] = operation
+                if parameters:
+                    operation["parameters"] = parameters
+                
+                path_item[method_name] = operation
     
     # Write or return
     if output_file:
@@ -333,24 +416,31 @@ def generate_openapi_spec(xsd_file, wadl_file=None, output_file=None,
         if output_format == 'yaml' and HAS_YAML:
             if HAS_RUAMEL_YAML:
                 # Use ruamel.yaml to preserve comments and add helpful ones
-                yaml_writer = YAML()
+                # (plain dicts without comments need no round-trip handling)
+                yaml_writer = YAML() if yaml_comments else YAML(typ='safe')
                 yaml_writer.preserve_quotes = True
                 yaml_writer.width = 4096  # Prevent line wrapping
                 yaml_writer.default_flow_style = False
+                if not yaml_comments:
+                    # Keep key order (set after the options above, which the
+                    # representer reads when it is created here)
+                    yaml_writer.representer.sort_base_mapping_type_on_output = False
                 
                 # Add helpful comments to the OpenAPI spec
-                openapi_with_comments = _add_yaml_comments(openapi, jsonld_context, include_context, context_output_file)
+                if yaml_comments:
+                    openapi_yaml = _add_yaml_comments(openapi, jsonld_context, include_context,
+                                                      context_output_file)
+                else:
+                    openapi_yaml = openapi
                 
                 with open(output_file, 'w') as f:
-                    yaml_writer.dump(openapi_with_comments, f)
+                    yaml_writer.dump(openapi_yaml, f)
             else:
                 # Fallback to pyyaml (no comment support)
                 with open(output_file, 'w') as f:
                     yaml.dump(openapi, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
         else:
-            import json
-            with open(output_file, 'w') as f:
-                json.dump(openapi, f, indent=2)
+            _write_json(openapi, output_file)
         
         # Print summary
         if include_context:
@@ -368,7 +458,19 @@ def generate_openapi_spec(xsd_file, wadl_file=None, output_file=None,
 
 def _add_yaml_comments(openapi, jsonld_context, include_context, context_output_file):
     """Add helpful comments to OpenAPI YAML structure using ruamel.yaml."""
-    from ruamel.yaml.comments import CommentedMap, CommentedSeq
+    key_comments = _KEY_COMMENTS
+    if include_context:
+        key_comments = dict(key_comments)
+        if context_output_file:
+            key_comments["x-jsonld-context"] = (
+                "JSON-LD Context Reference (IETF draft: draft-polli-restapi-ld-keywords)\n"
+                "This references an external context file for semantic understanding of API terms."
+            )
+        else:
+            key_comments["x-jsonld-context"] = (
+                "JSON-LD Context (IETF draft: draft-polli-restapi-ld-keywords)\n"
+                "Embedded context for semantic understanding of API terms, enum values, and type relationships."
+            )
     
     # Convert dict to CommentedMap to allow comments
     def add_comments_recursive(obj, path="", parent_dict=None):
@@ -379,52 +481,20 @@ def _add_yaml_comments(openapi, jsonld_context, include_context, context_output_
                 commented[key] = add_comments_recursive(value, f"{path}.{key}", obj)
                 
                 # Add comments based on key
-                if key == "openapi":
-                    commented.yaml_set_comment_before_after_key(key, before="OpenAPI Specification Version")
-                elif key == "info":
-                    commented.yaml_set_comment_before_after_key(key, before="API Information")
-                elif key == "servers":
-                    commented.yaml_set_comment_before_after_key(key, before="API Server URLs")
-                elif key == "paths":
-                    commented.yaml_set_comment_before_after_key(key, before="API Endpoints (from WADL)")
-                elif key == "components":
-                    commented.yaml_set_comment_before_after_key(key, before="Reusable Components")
-                elif key == "schemas":
-                    commented.yaml_set_comment_before_after_key(key, before="JSON Schema Definitions (from XSD)")
-                elif key == "x-jsonld-context":
-                    if include_context:
-                        if context_output_file:
-                            commented.yaml_set_comment_before_after_key(
-                                key, 
-                                before="JSON-LD Context Reference (IETF draft: draft-polli-restapi-ld-keywords)\n"
-                                       "This references an external context file for semantic understanding of API terms."
-                            )
-                        else:
-                            commented.yaml_set_comment_before_after_key(
-                                key,
-                                before="JSON-LD Context (IETF draft: draft-polli-restapi-ld-keywords)\n"
-                                       "Embedded context for semantic understanding of API terms, enum values, and type relationships."
-                            )
-                elif key == "x-enum-descriptions":
-                    # Add comment explaining this extension
-                    commented.yaml_set_comment_before_after_key(
-                        key,
-                        before="Enum value descriptions (bit positions and their meanings)"
-                    )
+                comment = key_comments.get(key)
+                if comment is not None:
+                    commented.yaml_set_comment_before_after_key(key, before=comment)
             
             # Second pass: add enum comments if x-enum-descriptions exists
-            if "enum" in commented and "x-enum-descriptions" in commented:
-                enum_value = commented["enum"]
-                enum_descriptions = commented["x-enum-descriptions"]
+            enum_value = commented.get("enum")
+            enum_descriptions = commented.get("x-enum-descriptions")
+            if enum_value is not None and enum_descriptions is not None:
                 if isinstance(enum_value, list):
-                    commented_seq = CommentedSeq()
-                    for item in enum_value:
-                        commented_seq.append(item)
+                    commented_seq = CommentedSeq(enum_value)
+                    for idx, item in enumerate(enum_value):
                         # Add comment for this enum value
-                        item_str = str(item)
-                        if item_str in enum_descriptions:
-                            desc = enum_descriptions[item_str]
-                            idx = len(commented_seq) - 1
+                        desc = enum_descriptions.get(str(item))
+                        if desc is not None:
                             commented_seq.yaml_add_eol_comment(desc, idx)
                     commented["enum"] = commented_seq
             
@@ -90,6 +90,36 @@ python3 cli.py openapi \
     --api-version "1.0.0" \
     --context-output-file "$OUTPUT_DIR/sep_context_linked_to_openapi.jsonld"
 
+# Example 10: Streamed output must be byte-identical to buffered output
+# (ref_elements.xsd uses element refs, which give non-string context keys)
+echo -e "\n${GREEN}Example 10: Checking streamed JSON-LD output${NC}"
+STREAM_DIR=$(mktemp -d)
+for schema in "$INPUT_DIR/sep.xsd" "$INPUT_DIR/ref_elements.xsd"; do
+    for command in jsonld-context jsonld-schema shacl; do
+        python3 cli.py $command "$schema" "$STREAM_DIR/buffered.jsonld" > /dev/null
+        python3 cli.py $command "$schema" "$STREAM_DIR/streamed.jsonld" --stream > /dev/null
+        cmp "$STREAM_DIR/buffered.jsonld" "$STREAM_DIR/streamed.jsonld"
+    done
+done
+rm -rf "$STREAM_DIR"
+echo "Streamed output matches buffered output"
+
+# Example 11: Nested WADL resources keep their own methods and documentation
+echo -e "\n${GREEN}Example 11: Checking nested WADL resources${NC}"
+python3 - "$INPUT_DIR/nested_wadl.xml" <<'PY'
+import sys
+from converters.core import WADLParser
+
+item, note = WADLParser().parse(sys.argv[1]).resources
+assert (item['title'], item['description']) == ('Item', 'Item resource')
+assert [m['id'] for m in item['methods']] == ['getItem'] and item['parameters'] == []
+assert (note['title'], note['description']) == ('Note', 'Note resource')
+assert [m['id'] for m in note['methods']] == ['getNote']
+assert [p['name'] for p in note['parameters']] == ['id']
+assert note['methods'][0]['request']['parameters'][0]['description'] == 'Start index'
+print("Nested resources are parsed independently")
+PY
+
 echo -e "\n${BLUE}=== All conversions complete! ===${NC}"
 echo -e "${YELLOW}Output files are in: $OUTPUT_DIR${NC}\n"
 